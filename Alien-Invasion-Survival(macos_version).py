@@ -4,14 +4,29 @@ Alien Invasion Survival
 -------------------------------------
 """
 
-from OpenGL.GL import *
-from OpenGL.GLUT import *
-from OpenGL.GLU import *
+import sys
 import random
 import math
 import os
+import time
+import ctypes
+from bisect import bisect_left, bisect_right
+from collections import deque
+from heapq import heapify, heappop, heappush
 from datetime import datetime
-import sys
+try:
+    from OpenGL.GL import *
+    from OpenGL.GLUT import *
+    from OpenGL.GLU import *
+except ImportError:
+    # Headless runs (--headless) never touch OpenGL, so it's optional there.
+    if "--headless" not in sys.argv:
+        raise
+    GLUT_BITMAP_HELVETICA_18 = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # =============================
 # Global / Config
@@ -31,6 +46,80 @@ ARENA_DEPTH = 3000
 
 # --- Testing Flag ---
 INVINCIBLE_MODE = False 
+# Cross-checks every compact_dead() pass against a plain filtered copy
+DEBUG_COMPACTION = False
+
+# --- Entity Storage ---
+# Bullets, enemy bullets and asteroids keep their numbers in flat Python
+# lists, one per field (see ProjectileStore). Drawing converts the live
+# slots to NumPy arrays when NumPy is installed.
+PROJECTILE_STORE_CAPACITY = 256
+
+# --- Projectile Pools ---
+# Removed lasers and enemy bullets are kept and reused (see ProjectilePool).
+# A pool never holds more idle objects than its high-water mark.
+BULLET_POOL_HIGH_WATER = 128
+ENEMY_BULLET_POOL_HIGH_WATER = 512
+
+# --- Particles ---
+# Visual effects (boss telegraphs, explosions, laser sparks) share one
+# fixed-size ring buffer; once it is full the oldest particle is reused.
+PARTICLE_CAPACITY = 512
+
+# --- Rendering ---
+# Draw all enemy bullets with one instanced draw call (needs NumPy and
+# OpenGL 3.3 / ARB_instanced_arrays, otherwise point sprites are used)
+USE_INSTANCED_BULLETS = True
+# Point sprites of similar radius share one glPointSize: radii that round
+# to the same power of this step are drawn together at their mean radius
+POINT_SPRITE_SIZE_STEP = 1.25
+# Number of background stars. They are animated on the GPU, so raising this
+# into the tens of thousands costs no Python time per frame.
+STAR_COUNT = 400
+# Skip drawing entities whose bounding sphere is outside the camera's view
+USE_FRUSTUM_CULLING = True
+# Show how many entities were drawn / culled this frame in the HUD
+SHOW_CULL_STATS = False
+# How many laid-out HUD strings the text renderer remembers before starting over
+TEXT_LAYOUT_CACHE_SIZE = 256
+
+# --- Level of Detail ---
+# Entity models are compiled at several tessellation levels (fraction of the
+# full slice/stack counts). A model uses level 0 while its radius covers at
+# least LOD_PIXEL_THRESHOLDS[0] pixels on screen, level 1 down to the next
+# threshold, and so on; anything smaller gets the last level.
+# The instanced sphere batches (enemy bullets, wall pieces, particles) hold
+# a sphere mesh per level too and issue one instanced draw per level.
+LOD_LEVELS = (1.0, 0.5, 0.25)
+LOD_PIXEL_THRESHOLDS = (40, 12)
+# Label every entity with the level it is drawn at
+SHOW_LOD_DEBUG = False
+
+# --- Frame Scheduling ---
+# Outside gameplay (menus, pause, skill menu, game over) nothing moves, so the
+# idle loop is switched off and the screen is only redrawn after input.
+EVENT_DRIVEN_MENUS = True
+# The simulation always advances in fixed ticks of 1/SIM_TICKS_PER_SECOND;
+# every duration in the game counts these ticks.
+SIM_TICKS_PER_SECOND = 60
+# Rendered frames per second the loop is held to (0 = as fast as GLUT calls
+# idle()). Each frame runs as many simulation ticks as real time calls for.
+# When vsync is switched on successfully the buffer swap paces the loop
+# instead and this is ignored.
+TARGET_FPS = 60
+# A slow frame may run up to this many ticks to catch up (so rendering drops
+# to as low as 60/5 = 12 FPS before the game itself slows down)
+MAX_SIM_TICKS_PER_FRAME = 5
+# Draw moving things part of the way between their last two tick positions
+INTERPOLATE_RENDERING = True
+# True/False asks the driver to turn vsync on/off; None leaves its default
+USE_VSYNC = None
+# Show the achieved frame rate and frame-time jitter in the HUD
+SHOW_FPS_STATS = False
+
+# --- Collision Broadphase ---
+# Edge length of the uniform grid cells used by check_collisions()
+BROADPHASE_CELL_SIZE = 250
 
 # --- Theme colors ---
 SPACE_BLUE    = (0.05, 0.05, 0.15)
@@ -89,14 +178,14 @@ star_positions = []
 
 # --- Weapon / bullets ---
 bullets = []
-weapon_cooldown = 0
+weapon_cooldown = None
 max_weapon_cooldown = 15
 bullet_speed = 45
 
 # --- Evasion (Q/E) ---
 is_evading = False
 evade_timer = 0
-evade_cooldown = 0
+evade_cooldown = None
 evade_direction = 0
 EVADE_DISTANCE_BASE = 200 
 EVADE_DURATION = 8
@@ -141,7 +230,7 @@ skill_health_boost = 0
 special_ability_meter = 0
 special_ability_max = 100
 special_ability_active = False
-special_ability_timer = 0
+special_ability_timer = None
 current_special = "DAMAGE_BOOST"
 SKILL_COSTS = {
     'faster_evasion': [1, 2, 3], 
@@ -160,8 +249,8 @@ for name in SKILL_COSTS:
 
 # Temporary skills (only unlock once, last for 2 minutes)
 temp_skills = {
-    "mobility_boost": {"cost": 1, "active": False, "duration": 0},
-    "weapon_mastery": {"cost": 1, "active": False, "duration": 0}
+    "mobility_boost": {"cost": 1, "active": False, "timer": None},
+    "weapon_mastery": {"cost": 1, "active": False, "timer": None}
 }
 
 
@@ -170,15 +259,20 @@ time_scale = 1
 
 # --- V-Menu Abilities ---
 mobility_boost_active = False
-mobility_boost_timer = 0
+mobility_boost_timer = None
 MOBILITY_BOOST_DURATION = 2 * 60 * 60 
 MOBILITY_BOOST_MULTIPLIER = 5
 weapon_mastery_active = False
-weapon_mastery_timer = 0
+weapon_mastery_timer = None
 WEAPON_MASTERY_DURATION = 2 * 60 * 60 
 WEAPON_MASTERY_DAMAGE_MULT = 2.5
 
 # --- Enemy AI ---
+# Boss wall attack: every row is WALL_COLUMNS spheres spread across the arena
+WALL_COLUMNS = 10
+WALL_RADIUS = 40
+WALL_DAMAGE = 10
+WALL_COLOR = (2, 0.6, 0)
 enemies = []
 enemy_bullets = []
 asteroids = []
@@ -189,6 +283,86 @@ obstacles = []
 # =============================
 # Classes
 # =============================
+class Timer:
+    """A countdown handed out by TimerWheel.schedule(); see ticks_left()."""
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled')
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel that runs the gameplay countdowns.
+    Instead of every cooldown being decremented once per tick, a timer is
+    filed under the tick it expires on and its callback runs then, so
+    waiting costs nothing. Level 0 has one slot per tick for the next 64
+    ticks; each level above covers 64 times the span of the one below, and
+    its slots are emptied into the lower levels (cascaded) as the wheel
+    turns. Timers without a callback are plain deadlines and never enter
+    the wheel. advance() only runs during gameplay ticks, so pausing the
+    game pauses every timer.
+    """
+    SLOT_BITS = 6
+    SLOTS = 1 << SLOT_BITS
+    LEVELS = 4
+
+    def __init__(self):
+        self.now = 0
+        self.levels = [[[] for _ in range(self.SLOTS)] for _ in range(self.LEVELS)]
+
+    def schedule(self, delay, callback=None, *args):
+        """Returns a Timer that runs callback(*args) after delay ticks (rounded up, at least 1)."""
+        timer = Timer(self.now + max(1, math.ceil(delay)), callback, args)
+        if callback is not None:
+            self.insert(timer)
+        return timer
+
+    def cancel(self, timer):
+        # Cancelled timers stay filed and are dropped when their slot comes up
+        if timer is not None:
+            timer.cancelled = True
+
+    def insert(self, timer):
+        delay = timer.deadline - self.now
+        for level in range(self.LEVELS):
+            if delay < self.SLOTS << (self.SLOT_BITS * level) or level == self.LEVELS - 1:
+                slot = (timer.deadline >> (self.SLOT_BITS * level)) & (self.SLOTS - 1)
+                self.levels[level][slot].append(timer)
+                return
+
+    def advance(self):
+        """Moves the wheel on one tick and runs every timer expiring on it."""
+        self.now += 1
+        # Every level whose lower levels just wrapped around hands its slot down
+        level = 1
+        while level < self.LEVELS and self.now & ((1 << (self.SLOT_BITS * level)) - 1) == 0:
+            level += 1
+        for level in range(level - 1, 0, -1):
+            slots = self.levels[level]
+            index = (self.now >> (self.SLOT_BITS * level)) & (self.SLOTS - 1)
+            due, slots[index] = slots[index], []
+            for timer in due:
+                if not timer.cancelled:
+                    self.insert(timer)
+        slots = self.levels[0]
+        index = self.now & (self.SLOTS - 1)
+        due, slots[index] = slots[index], []
+        for timer in due:
+            if not timer.cancelled:
+                timer.cancelled = True  # Spent
+                timer.callback(*timer.args)
+
+timers = TimerWheel()
+
+def ticks_left(timer):
+    """Ticks until a timer runs out; 0 once it has, if it was cancelled, or for None."""
+    if timer is None or timer.cancelled:
+        return 0
+    return max(0, timer.deadline - timers.now)
+
 class Obstacle:
     def __init__(self, pos, size, type):
         self.pos = pos
@@ -197,30 +371,29 @@ class Obstacle:
         self.type = type 
         self.alive = True
         self.health = 100
-        self.respawn_timer = -1 
+        self.respawn_timer = None
 
     def damage(self, amount):
         if self.type == 'Shootable':
             self.health -= amount
             if self.health <= 0:
                 self.alive = False
-                self.respawn_timer = 600 
+                self.respawn_timer = timers.schedule(600, self.respawn)
+                obstacle_index.invalidate()
+                particles.burst(self.pos, 20, 5, self.size * 0.15, 40, (0.7, 0.5, 0.3))
                 trigger_camera_shake(8, 12)
 
-    def update(self):
-        # Respawn Logic
-        if self.respawn_timer > 0:
-            self.respawn_timer -= 1
-            if self.respawn_timer == 0:
-                # Reset Obstacle
-                self.alive = True
-                self.health = 100
-                # Random Position
-                self.pos[0] = random.uniform(-ARENA_WIDTH * 0.9, ARENA_WIDTH * 0.9)
-                self.pos[1] = random.uniform(-ARENA_HEIGHT * 0.9, ARENA_HEIGHT * 0.9)
-                self.pos[2] = random.uniform(ARENA_DEPTH * 0.2, ARENA_DEPTH * 0.8)
-               
-                self.respawn_timer = -1
+    def respawn(self):
+        # Reset Obstacle
+        self.alive = True
+        self.health = 100
+        # Random Position
+        self.pos[0] = random.uniform(-ARENA_WIDTH * 0.9, ARENA_WIDTH * 0.9)
+        self.pos[1] = random.uniform(-ARENA_HEIGHT * 0.9, ARENA_HEIGHT * 0.9)
+        self.pos[2] = random.uniform(ARENA_DEPTH * 0.2, ARENA_DEPTH * 0.8)
+
+        self.respawn_timer = None
+        obstacle_index.invalidate()
 
     def draw(self):
         if not self.alive: return
@@ -234,60 +407,343 @@ class Obstacle:
         glutSolidCube(self.size)
         glPopMatrix()
 
-class Bullet:
+class ProjectileStore:
+    """
+    Structure-of-arrays storage for one kind of projectile.
+    Each projectile owns a slot, and its position, direction, speed, radius,
+    damage, color, orientation axes and alive flag sit in one list per field,
+    so a whole kind can be processed in one go instead of object by object.
+    The fields are plain Python lists: gameplay code still reads bullet.pos
+    or bullet.alive one projectile at a time, and at the handful to few
+    hundred projectiles alive at once, list items beat NumPy rows and
+    scalars both there and in the batched passes. So the passes below are
+    single Python loops over the store, not NumPy vector operations.
+    prev_pos keeps each position from before the last simulation tick, for
+    render interpolation.
+    The lists grow (doubling) if the capacity runs out.
+    Free slots are handed out lowest first, and high_water is one past the
+    highest slot that may still be alive, so the batched passes only cover
+    [:high_water] and skip an empty store altogether.
+    """
+    def __init__(self, capacity=PROJECTILE_STORE_CAPACITY):
+        self.capacity = 0
+        self.free_slots = []
+        self.high_water = 0
+        self.pos, self.prev_pos, self.vector, self.color, self.axes = [], [], [], [], []
+        self.speed, self.radius, self.damage, self.alive = [], [], [], []
+        self.grow(capacity)
+
+    def grow(self, new_capacity):
+        old_capacity = self.capacity
+        if new_capacity <= old_capacity:
+            return
+        extra = new_capacity - old_capacity
+        self.pos += [[0.0, 0.0, 0.0] for _ in range(extra)]
+        self.prev_pos += [[0.0, 0.0, 0.0] for _ in range(extra)]
+        self.vector += [[0.0, 0.0, 0.0] for _ in range(extra)]
+        self.speed += [0.0] * extra
+        self.radius += [0.0] * extra
+        self.damage += [0] * extra
+        self.color += [[0.0, 0.0, 0.0] for _ in range(extra)]
+        self.axes += [[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]] for _ in range(extra)]
+        self.alive += [False] * extra
+        # A min-heap, so allocate() always hands out the lowest free slot
+        self.free_slots += range(old_capacity, new_capacity)
+        heapify(self.free_slots)
+        self.capacity = new_capacity
+
+    def allocate(self):
+        if not self.free_slots:
+            self.grow(max(16, self.capacity * 2))
+        slot = heappop(self.free_slots)
+        self.alive[slot] = True
+        self.high_water = max(self.high_water, slot + 1)
+        return slot
+
+    def release(self, slot):
+        self.alive[slot] = False
+        heappush(self.free_slots, slot)
+        while self.high_water and not self.alive[self.high_water - 1]:
+            self.high_water -= 1
+
+    def snapshot(self):
+        """Copies every position into prev_pos (done before each simulation tick)."""
+        for slot in range(self.high_water):
+            self.prev_pos[slot][:] = self.pos[slot]
+
+    def interpolated_pos(self, alpha):
+        """
+        Positions alpha of the way from prev_pos to pos, for drawing between
+        two ticks. Only [:high_water] is interpolated; the slots past it
+        hold nothing alive and are passed through as they are.
+        """
+        count = self.high_water
+        if count == 0:
+            return self.pos
+        moved = [lerp_position(prev, current, alpha) for prev, current in zip(self.prev_pos[:count], self.pos[:count])]
+        return moved + self.pos[count:]
+
+    def integrate(self, step, min_z, max_z=float('inf'), check_before_move=False):
+        """
+        Moves every live projectile by vector * speed * step in one loop over
+        [:high_water] and kills those whose z is outside [min_z, max_z]. The bounds are checked
+        on the old position when check_before_move is set (enemy projectiles
+        have always worked that way) and on the new one otherwise.
+        Returns the slots killed this step.
+        """
+        killed = []
+        alive, positions, vectors, speeds = self.alive, self.pos, self.vector, self.speed
+        for slot in range(self.high_water):
+            if not alive[slot]:
+                continue
+            pos, vector = positions[slot], vectors[slot]
+            if check_before_move and not (min_z <= pos[2] <= max_z):
+                killed.append(slot)
+            distance = speeds[slot] * step
+            pos[0] += vector[0] * distance
+            pos[1] += vector[1] * distance
+            pos[2] += vector[2] * distance
+            if not check_before_move and not (min_z <= pos[2] <= max_z):
+                killed.append(slot)
+        for slot in killed:
+            alive[slot] = False
+        return killed
+
+    def hit_sphere(self, center, radius):
+        """
+        Kills every live projectile overlapping the sphere in one loop over
+        [:high_water]. Returns (slots hit, their total damage).
+        """
+        slots, total = [], 0
+        alive, positions, radii = self.alive, self.pos, self.radius
+        cx, cy, cz = center
+        for slot in range(self.high_water):
+            if not alive[slot]:
+                continue
+            pos = positions[slot]
+            dx, dy, dz = pos[0] - cx, pos[1] - cy, pos[2] - cz
+            reach = radii[slot] + radius
+            if dx*dx + dy*dy + dz*dz < reach * reach:
+                slots.append(slot)
+                total += self.damage[slot]
+                alive[slot] = False
+        return slots, total
+
+    def live_slots(self):
+        """Indices of every slot whose projectile is still alive."""
+        return [slot for slot in range(self.high_water) if self.alive[slot]]
+
+    def gather(self, field, slots):
+        """One field's values for the given slots as a NumPy array (used when drawing)."""
+        column = getattr(self, field)
+        shape = np.shape(column[0]) if column else ()
+        return np.array([column[slot] for slot in slots], dtype=float).reshape((len(slots),) + shape)
+
+    def __len__(self):
+        return self.capacity - len(self.free_slots)
+
+class Projectile:
+    """
+    Base class for Bullet, EnemyBullet and Asteroid.
+    The numeric state lives in a ProjectileStore slot; the properties below
+    keep the usual bullet.pos / bullet.speed / bullet.alive access working,
+    so spawning code and collision checks don't need to know about the store.
+    Subclasses call claim_slot() before setting any field, and release()
+    once the projectile has been removed from its list.
+    """
+    def __init__(self, store):
+        self.store = store
+        self.slot = None
+
+    def claim_slot(self):
+        if self.slot is None:
+            self.slot = self.store.allocate()
+
+    def release(self):
+        if self.slot is not None:
+            self.store.release(self.slot)
+            self.slot = None
+
+    @property
+    def pos(self):
+        return self.store.pos[self.slot]
+    @pos.setter
+    def pos(self, value):
+        # Placing a projectile is a jump, not motion: nothing to interpolate
+        self.store.pos[self.slot][:] = value
+        self.store.prev_pos[self.slot][:] = value
+
+    @property
+    def prev_pos(self):
+        return self.store.prev_pos[self.slot]
+
+    @property
+    def vector(self):
+        return self.store.vector[self.slot]
+    @vector.setter
+    def vector(self, value):
+        self.store.vector[self.slot][:] = value
+
+    @property
+    def speed(self):
+        return self.store.speed[self.slot]
+    @speed.setter
+    def speed(self, value):
+        self.store.speed[self.slot] = value
+
+    @property
+    def radius(self):
+        return self.store.radius[self.slot]
+    @radius.setter
+    def radius(self, value):
+        self.store.radius[self.slot] = value
+
+    @property
+    def damage(self):
+        return self.store.damage[self.slot]
+    @damage.setter
+    def damage(self, value):
+        self.store.damage[self.slot] = value
+
+    @property
+    def color(self):
+        return self.store.color[self.slot]
+    @color.setter
+    def color(self, value):
+        self.store.color[self.slot][:] = value
+
+    @property
+    def axes(self):
+        return self.store.axes[self.slot]
+    @axes.setter
+    def axes(self, value):
+        self.store.axes[self.slot][:] = value
+
+    @property
+    def alive(self):
+        return bool(self.store.alive[self.slot])
+    @alive.setter
+    def alive(self, value):
+        self.store.alive[self.slot] = value
+
+class ProjectilePool:
+    """
+    Free list of removed projectiles of one class, so firing doesn't build
+    a new object (and new lists) for every shot.
+    acquire() takes an idle object and re-runs its reset() - the same code
+    its constructor runs - and only builds a new one if the pool is empty.
+    recycle() releases the store slot and keeps the object for later, up to
+    high_water idle objects; anything beyond that is left to the GC.
+    """
+    def __init__(self, projectile_class, high_water):
+        self.projectile_class = projectile_class
+        self.high_water = high_water
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        if self.free:
+            projectile = self.free.pop()
+            projectile.reset(*args)
+            self.reused += 1
+        else:
+            projectile = self.projectile_class(*args)
+            self.created += 1
+        return projectile
+
+    def recycle(self, projectile):
+        projectile.release()
+        if len(self.free) < self.high_water:
+            self.free.append(projectile)
+
+def clear_projectiles(projectiles, pool=None):
+    """Empties a projectile list, giving every slot back to the store (and every object to the pool)."""
+    for projectile in projectiles:
+        if pool:
+            pool.recycle(projectile)
+        else:
+            projectile.release()
+    projectiles.clear()
+
+def laser_axes(vector):
+    """
+    Right, up and forward unit axes for a laser flying along vector.
+    A laser's direction never changes, so this runs once when it is fired
+    instead of every frame. A vector with no length points down +z.
+    """
+    length = math.sqrt(vector[0]**2 + vector[1]**2 + vector[2]**2)
+    if length == 0:
+        return [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    fx, fy, fz = vector[0] / length, vector[1] / length, vector[2] / length
+    # Right is world-up x forward; a straight up/down laser uses world x instead
+    horizontal = math.sqrt(fx**2 + fz**2)
+    if horizontal < 1e-6:
+        rx, ry, rz = 1.0, 0.0, 0.0
+    else:
+        rx, ry, rz = fz / horizontal, 0.0, -fx / horizontal
+    ux, uy, uz = fy*rz - fz*ry, fz*rx - fx*rz, fx*ry - fy*rx
+    return [[rx, ry, rz], [ux, uy, uz], [fx, fy, fz]]
+
+# --- One store per projectile kind ---
+bullet_store = ProjectileStore()
+enemy_bullet_store = ProjectileStore()
+asteroid_store = ProjectileStore()
+
+class Bullet(Projectile):
     def __init__(self, start_pos, vector):
-        self.pos = list(start_pos)
+        Projectile.__init__(self, bullet_store)
+        self.reset(start_pos, vector)
+
+    def reset(self, start_pos, vector):
+        self.claim_slot()
+        self.pos = start_pos
         self.vector = vector
+        self.axes = laser_axes(vector)
         self.speed = bullet_speed
         self.alive = True
         self.damage = get_weapon_damage()
         self.radius = 3.5
 
-    def update(self):
-        if self.alive:
-            if weapon_mastery_active:
-                current_speed = self.speed * 2 
-            else:
-                current_speed = self.speed * 1 
-            self.pos[0] += self.vector[0] * current_speed
-            self.pos[1] += self.vector[1] * current_speed
-            self.pos[2] += self.vector[2] * current_speed
-            if self.pos[2] > ARENA_DEPTH + 200 or self.pos[2] < -200: 
-                self.alive = False
+    @staticmethod
+    def update_all():
+        """
+        Moves every laser in one pass over bullet_store. Lasers ignore TIME_SLOW.
+        The old positions are kept in prev_pos, so check_collisions() can
+        test the whole path each laser covered this tick.
+        """
+        if weapon_mastery_active:
+            speed_scale = 2
+        else:
+            speed_scale = 1
+        bullet_store.snapshot()
+        bullet_store.integrate(speed_scale, -200, ARENA_DEPTH + 200)
 
     def draw(self):
+        # Per-laser path without NumPy; draw_lasers() batches the rest
         if not self.alive: return
         glPushMatrix()
         glTranslatef(self.pos[0], self.pos[1], self.pos[2])
-
-        # We only need to calculate rotation if the vector has a length.
-        # If the vector is [0, 0, 0], it has no direction, so we can skip rotation.
-        if self.vector[0] != 0 or self.vector[1] != 0 or self.vector[2] != 0:
-
-            # --- Calculate Y-axis rotation (Yaw) ---
-            # This orients the laser based on its X and Z direction.
-            angle_y = -math.degrees(math.atan2(self.vector[2], self.vector[0])) + 90
-            glRotatef(angle_y, 0, 1, 0)
-            
-            # --- Calculate X-axis rotation (Pitch) ---
-            # This tilts the laser up or down.
-            v_horiz = math.sqrt(self.vector[0]**2 + self.vector[2]**2)
-            
-            # We can calculate angle_x directly. math.atan2 handles the case where
-            # v_horiz is 0, which fixes the bug for vertical vectors.
-            angle_x = -math.degrees(math.atan2(self.vector[1], v_horiz))
-            glRotatef(angle_x, 1, 0, 0)
-        
-        # --- Draw the laser cylinder ---
+        right, up, forward = self.axes
+        glMultMatrixf([right[0], right[1], right[2], 0,
+                       up[0], up[1], up[2], 0,
+                       forward[0], forward[1], forward[2], 0,
+                       0, 0, 0, 1])
         glColor3f(*ENERGY_YELLOW)
         laser_length = 80+ (skill_weapon_power * 20)
         laser_width = 1.5 + (skill_weapon_power * 0.5)
-        gluCylinder(gluNewQuadric(), laser_width, laser_width/2, laser_length, 8, 1)
+        glScalef(laser_width, laser_width, laser_length)
+        draw_mesh('laser')
         glPopMatrix()
 
-class EnemyBullet:
+class EnemyBullet(Projectile):
     def __init__(self, start_pos, type):
-        self.pos = list(start_pos)
+        Projectile.__init__(self, enemy_bullet_store)
+        self.reset(start_pos, type)
+
+    def reset(self, start_pos, type):
+        self.claim_slot()
+        self.pos = start_pos
         self.type = type
         self.alive = True
         self.vector = [0, 0, -1] 
@@ -298,12 +754,6 @@ class EnemyBullet:
             self.radius = 7
             self.color = (2, 0.6, 0) 
             self.vector = [0, 0, -1] 
-        if self.type == 'WALL':
-            base_speed = 1.7 
-            self.damage = 10 
-            self.radius = 7
-            self.color = (2, 0.6, 0) 
-            self.vector = [0, 0, -1] 
         elif self.type == 'HOMING':
             base_speed = 1.4
             self.damage = 10 
@@ -315,32 +765,31 @@ class EnemyBullet:
             self.radius = 15
             self.color = NEON_CYAN
         self.speed = base_speed * enemy_bullet_speed_multiplier
-        if self.type != "WALL":
-            dir_x, dir_y, dir_z = player_pos[0] - self.pos[0], player_pos[1] - self.pos[1], player_pos[2] - self.pos[2]
-            dist = math.sqrt(dir_x**2 + dir_y**2 + dir_z**2)
-            if dist > 0: self.vector = [dir_x / dist, dir_y / dist, dir_z / dist]
+        dir_x, dir_y, dir_z = player_pos[0] - self.pos[0], player_pos[1] - self.pos[1], player_pos[2] - self.pos[2]
+        dist = math.sqrt(dir_x**2 + dir_y**2 + dir_z**2)
+        if dist > 0: self.vector = [dir_x / dist, dir_y / dist, dir_z / dist]
 
-    def update(self):
-        if self.alive: 
-            if self.pos[2] < -100: 
-                self.alive = False
-            self.pos[0] += self.vector[0] * self.speed * time_scale
-            self.pos[1] += self.vector[1] * self.speed * time_scale
-            self.pos[2] += self.vector[2] * self.speed * time_scale
+    @staticmethod
+    def update_all():
+        """Moves every enemy bullet in one pass over enemy_bullet_store."""
+        enemy_bullet_store.integrate(time_scale, -100, check_before_move=True)
 
-            
     def draw(self):
         if not self.alive: 
             return
+        level = select_lod(self.pos, self.radius)
         glPushMatrix() 
         glTranslatef(self.pos[0], self.pos[1], self.pos[2])
+        glScalef(self.radius, self.radius, self.radius)
         glColor3f(*self.color) 
-        gluSphere(gluNewQuadric(), self.radius, 10, 8)
+        draw_mesh('enemy_bullet', level)
         glPopMatrix()
 
-class Asteroid:
+class Asteroid(Projectile):
     def __init__(self, start_pos, target_pos=None):
-        self.pos = list(start_pos)
+        Projectile.__init__(self, asteroid_store)
+        self.claim_slot()
+        self.pos = start_pos
         self.alive = True
         self.speed = 1.2 * enemy_bullet_speed_multiplier
         self.damage = 20
@@ -359,23 +808,306 @@ class Asteroid:
         else:
             self.vector = [0,0,-1]
     
-    def update(self):
-        if  self.alive: 
-            if self.pos[2] < -100: 
-                self.alive = False
-            self.pos[0] += self.vector[0] * self.speed * time_scale 
-            self.pos[1] += self.vector[1] * self.speed * time_scale
-            self.pos[2] += self.vector[2] * self.speed * time_scale
-            
+    @staticmethod
+    def update_all():
+        """Moves every asteroid in one pass over asteroid_store."""
+        asteroid_store.integrate(time_scale, -100, check_before_move=True)
+
     def draw(self):
         if not self.alive: 
             return
+        level = select_lod(self.pos, self.radius)
         glPushMatrix()
         glTranslatef(self.pos[0], self.pos[1], self.pos[2])
+        glScalef(self.radius, self.radius, self.radius)
         glColor3f(*ASTEROID_GREY) 
-        gluSphere(gluNewQuadric(), self.radius, 5, 5)
+        draw_mesh('asteroid', level)
         glPopMatrix()
 
+class WallHazard:
+    """
+    The boss WALL_ATTACK as one moving hazard instead of hundreds of bullets.
+    Each row of the wall is a line of WALL_COLUMNS spheres at one height,
+    evenly spaced across the arena and sliding towards the player together.
+    A per-column alive mask leaves out the safe gap and the pieces that have
+    already hit the player. Rows live in arrays (lists without NumPy), so
+    they all move, get tested against the player and get drawn in one go.
+    """
+    def __init__(self):
+        self.use_numpy = np is not None
+        # Column x positions never change, so they are laid out once here
+        spacing = ARENA_WIDTH / WALL_COLUMNS
+        self.columns = [-ARENA_WIDTH / 2 + i * spacing + spacing / 2 for i in range(WALL_COLUMNS)]
+        if self.use_numpy:
+            self.columns = np.array(self.columns)
+        self.clear()
+
+    def clear(self):
+        if self.use_numpy:
+            self.z = np.zeros(0)
+            self.prev_z = np.zeros(0)
+            self.y = np.zeros(0)
+            self.speed = np.zeros(0)
+            self.alive = np.zeros((0, WALL_COLUMNS), dtype=bool)
+        else:
+            self.z, self.prev_z, self.y, self.speed, self.alive = [], [], [], [], []
+
+    def __len__(self):
+        return len(self.z)
+
+    def spawn_row(self, y, z, gap_x, gap_width, speed):
+        """Adds a row at height y and depth z, minus the columns within gap_width of gap_x."""
+        if self.use_numpy:
+            mask = np.abs(self.columns - gap_x) >= gap_width
+            self.z = np.append(self.z, z)
+            self.prev_z = np.append(self.prev_z, z)
+            self.y = np.append(self.y, y)
+            self.speed = np.append(self.speed, speed)
+            self.alive = np.concatenate((self.alive, [mask]))
+        else:
+            mask = [abs(x - gap_x) >= gap_width for x in self.columns]
+            self.z.append(z)
+            self.prev_z.append(z)
+            self.y.append(y)
+            self.speed.append(speed)
+            self.alive.append(mask)
+
+    def keep(self, rows):
+        if self.use_numpy:
+            self.z, self.prev_z, self.y = self.z[rows], self.prev_z[rows], self.y[rows]
+            self.speed, self.alive = self.speed[rows], self.alive[rows]
+        else:
+            self.z = [self.z[i] for i in rows]
+            self.prev_z = [self.prev_z[i] for i in rows]
+            self.y = [self.y[i] for i in rows]
+            self.speed = [self.speed[i] for i in rows]
+            self.alive = [self.alive[i] for i in rows]
+
+    def update(self):
+        """Drops the rows that are empty or behind the player (checked before moving, like enemy bullets) and moves the rest."""
+        if len(self.z) == 0:
+            return
+        if self.use_numpy:
+            self.keep(np.flatnonzero((self.z >= -100) & self.alive.any(axis=1)))
+            self.z -= self.speed * time_scale
+            return
+        self.keep([i for i in range(len(self.z)) if self.z[i] >= -100 and any(self.alive[i])])
+        self.z = [z - speed * time_scale for z, speed in zip(self.z, self.speed)]
+
+    def snapshot(self):
+        if len(self.z):
+            self.prev_z = self.z.copy()
+
+    def interpolated_z(self, alpha):
+        if self.use_numpy:
+            return self.prev_z + (self.z - self.prev_z) * alpha
+        return [prev + (z - prev) * alpha for prev, z in zip(self.prev_z, self.z)]
+
+    def hit_sphere(self, center, radius):
+        """
+        Kills every wall piece overlapping the sphere and returns (pieces hit,
+        their total damage). Per row, the pieces in reach are the columns
+        within sqrt(reach^2 - dy^2 - dz^2) of the sphere along x.
+        """
+        if len(self.z) == 0:
+            return 0, 0
+        reach = WALL_RADIUS + radius
+        if self.use_numpy:
+            half_width_sq = reach * reach - (self.y - center[1])**2 - (self.z - center[2])**2
+            near = half_width_sq > 0
+            if not near.any():
+                return 0, 0
+            half_width = np.sqrt(np.where(near, half_width_sq, 0))
+            hit = self.alive & (np.abs(self.columns - center[0])[None, :] < half_width[:, None])
+            count = int(hit.sum())
+            self.alive &= ~hit
+            return count, count * WALL_DAMAGE
+
+        count = 0
+        for row in range(len(self.z)):
+            half_width_sq = reach * reach - (self.y[row] - center[1])**2 - (self.z[row] - center[2])**2
+            if half_width_sq <= 0:
+                continue
+            half_width = math.sqrt(half_width_sq)
+            alive = self.alive[row]
+            for column, x in enumerate(self.columns):
+                if alive[column] and abs(x - center[0]) < half_width:
+                    alive[column] = False
+                    count += 1
+        return count, count * WALL_DAMAGE
+
+    def instances(self):
+        """One (x, y, z, radius, r, g, b) row per live piece, for draw_enemy_bullets()."""
+        rows, columns = np.nonzero(self.alive)
+        instances = np.empty((len(rows), 7), dtype=np.float32)
+        instances[:, 0] = self.columns[columns]
+        instances[:, 1] = self.y[rows]
+        instances[:, 2] = self.z[rows]
+        instances[:, 3] = WALL_RADIUS
+        instances[:, 4:7] = np.clip(WALL_COLOR, 0, 1)
+        return instances
+
+    def draw(self):
+        # Per-piece path for the list-backed rows; draw_enemy_bullets() batches the rest
+        glColor3f(*WALL_COLOR)
+        for row in range(len(self.z)):
+            for column, x in enumerate(self.columns):
+                pos = (x, self.y[row], self.z[row])
+                if not self.alive[row][column] or not sphere_in_view(pos, WALL_RADIUS):
+                    continue
+                level = select_lod(pos, WALL_RADIUS)
+                glPushMatrix()
+                glTranslatef(*pos)
+                glScalef(WALL_RADIUS, WALL_RADIUS, WALL_RADIUS)
+                draw_mesh('enemy_bullet', level)
+                glPopMatrix()
+
+wall_hazard = WallHazard()
+
+class ParticleSystem:
+    """
+    Fixed-capacity, array-backed storage for short-lived visual particles.
+    Each particle is a sphere with a position, velocity, size, growth per
+    tick (negative to shrink), remaining life in ticks and color, one array
+    per field (lists without NumPy). New particles take the next slot of a
+    ring buffer, overwriting the oldest one when every slot is busy, so
+    spawning never allocates. update() moves, grows and ages all of them in
+    one step, and draw() sends the live ones through the enemy bullet batch.
+    active counts the ticks until the longest-lived particle runs out, so
+    with nothing alive every pass returns straight away.
+    Effects use their own random generator, so they never change the game's
+    random sequence.
+    """
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.use_numpy = np is not None
+        self.capacity = capacity
+        self.random = random.Random()
+        if self.use_numpy:
+            self.pos = np.zeros((capacity, 3))
+            self.prev_pos = np.zeros((capacity, 3))
+            self.velocity = np.zeros((capacity, 3))
+            self.size = np.zeros(capacity)
+            self.growth = np.zeros(capacity)
+            self.life = np.zeros(capacity)
+            self.color = np.zeros((capacity, 3))
+        else:
+            self.pos = [[0.0, 0.0, 0.0] for _ in range(capacity)]
+            self.prev_pos = [[0.0, 0.0, 0.0] for _ in range(capacity)]
+            self.velocity = [[0.0, 0.0, 0.0] for _ in range(capacity)]
+            self.size = [0.0] * capacity
+            self.growth = [0.0] * capacity
+            self.life = [0] * capacity
+            self.color = [(0.0, 0.0, 0.0)] * capacity
+        self.next_slot = 0
+        self.active = 0
+
+    def interpolated_pos(self, alpha):
+        """Positions alpha of the way from prev_pos to pos, for drawing between two ticks."""
+        if self.active == 0:
+            return self.pos
+        if self.use_numpy:
+            delta = self.pos - self.prev_pos
+            moved = self.prev_pos + delta * alpha
+            jumped = (delta * delta).sum(axis=1) > TELEPORT_DISTANCE ** 2
+            moved[jumped] = self.pos[jumped]
+            return moved
+        return [lerp_position(prev, current, alpha) for prev, current in zip(self.prev_pos, self.pos)]
+
+    def clear(self):
+        for slot in range(self.capacity):
+            self.life[slot] = 0
+        self.active = 0
+
+    def emit(self, pos, velocity, size, growth, life, color):
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % self.capacity
+        self.pos[slot][:] = pos
+        self.prev_pos[slot][:] = pos
+        self.velocity[slot][:] = velocity
+        self.size[slot] = size
+        self.growth[slot] = growth
+        self.life[slot] = life
+        self.color[slot] = color
+        self.active = max(self.active, life)
+
+    def burst(self, center, count, speed, size, life, color):
+        """count particles flying out of center in random directions, shrinking away over their life."""
+        for _ in range(count):
+            x, y, z = self.random.gauss(0, 1), self.random.gauss(0, 1), self.random.gauss(0, 1)
+            scale = speed * self.random.uniform(0.3, 1) / (math.sqrt(x*x + y*y + z*z) or 1)
+            self.emit(center, (x * scale, y * scale, z * scale), size, -size / life, life, color)
+
+    def update(self):
+        """Moves, grows and ages every live particle by one tick."""
+        if self.active == 0:
+            return
+        self.active -= 1
+        if self.use_numpy:
+            live = self.life > 0
+            self.pos[live] += self.velocity[live]
+            self.size[live] += self.growth[live]
+            self.life[live] -= 1
+            return
+        for slot in range(self.capacity):
+            if self.life[slot] <= 0:
+                continue
+            pos, velocity = self.pos[slot], self.velocity[slot]
+            pos[0] += velocity[0]
+            pos[1] += velocity[1]
+            pos[2] += velocity[2]
+            self.size[slot] += self.growth[slot]
+            self.life[slot] -= 1
+
+    def snapshot(self):
+        if self.active == 0:
+            return
+        if self.use_numpy:
+            np.copyto(self.prev_pos, self.pos)
+        else:
+            for slot in range(self.capacity):
+                self.prev_pos[slot][:] = self.pos[slot]
+
+    def live_slots(self):
+        if self.active == 0:
+            return np.zeros(0, dtype=int) if self.use_numpy else []
+        if self.use_numpy:
+            return np.flatnonzero((self.life > 0) & (self.size > 0))
+        return [slot for slot in range(self.capacity) if self.life[slot] > 0 and self.size[slot] > 0]
+
+    def draw(self):
+        if enemy_bullet_renderer is None:
+            # Per-particle path for the list-backed store
+            for slot in self.live_slots():
+                pos, size = self.pos[slot], self.size[slot]
+                if not sphere_in_view(pos, size): continue
+                level = select_lod(pos, size)
+                glPushMatrix()
+                glTranslatef(pos[0], pos[1], pos[2])
+                glScalef(size, size, size)
+                glColor3f(*self.color[slot])
+                draw_mesh('charge_particle', level)
+                glPopMatrix()
+            return
+        slots = self.live_slots()
+        slots = slots[spheres_in_view(self.pos[slots], self.size[slots])]
+        if len(slots) == 0:
+            return
+        # Same row layout as the enemy bullets: x, y, z, radius, r, g, b
+        instances = np.empty((len(slots), 7), dtype=np.float32)
+        instances[:, 0:3] = self.pos[slots]
+        instances[:, 3] = self.size[slots]
+        instances[:, 4:7] = np.clip(self.color[slots], 0, 1)
+        if enemy_bullet_renderer["mode"] == "instanced":
+            draw_instanced_spheres(instances)
+        else:
+            draw_point_sprites(instances)
+
+particles = ParticleSystem()
+
+# --- Pools for the projectiles that get spawned every few frames ---
+bullet_pool = ProjectilePool(Bullet, BULLET_POOL_HIGH_WATER)
+enemy_bullet_pool = ProjectilePool(EnemyBullet, ENEMY_BULLET_POOL_HIGH_WATER)
+
 class Enemy:
     def __init__(self):
         chance = random.random()
@@ -389,6 +1121,7 @@ class Enemy:
         pos_x= random.uniform(-ARENA_WIDTH*0.8, ARENA_WIDTH*0.8)
         pos_y= random.uniform(-ARENA_HEIGHT*0.8, ARENA_HEIGHT*0.8)
         self.pos = [pos_x, pos_y, ARENA_DEPTH]
+        self.prev_pos = None
         self.target_z = ARENA_DEPTH - 800
         self.alive = True
         
@@ -418,7 +1151,11 @@ class Enemy:
             self.score_value = 150 
             self.xp_value = 10
 
+        # fire_cooldown and warp_cooldown hold the ticks left while the
+        # countdowns are stopped; they only run once the enemy has arrived
         self.fire_cooldown = self.fire_rate * time_scale
+        self.fire_timer = None
+        self.warp_timer = None
         if random.random()> 0.5:
             self.move_direction = 1   
         else:
@@ -432,28 +1169,43 @@ class Enemy:
                 self.pos[0] += self.move_speed * self.move_direction * time_scale
                 if abs(self.pos[0]) > ARENA_WIDTH * 0.9: 
                     self.move_direction *= -1
-            
-            if self.type == 'WARPER':
-                self.warp_cooldown -= 1
-                if self.warp_cooldown <= 0:
-                    pos_x=random.uniform(-ARENA_WIDTH*0.8, ARENA_WIDTH*0.8)
-                    pos_y=random.uniform(-ARENA_HEIGHT*0.8, ARENA_HEIGHT*0.8)
-                    self.pos = [pos_x, pos_y , ARENA_DEPTH]
-                    self.warp_cooldown = 2500
-
-            self.fire_cooldown -= 1
-            if self.fire_cooldown <= 0:
-                if self.type == 'GUARDIAN': 
-                    bullet_type = 'BIG'
-                elif self.type == 'GRUNT': 
-                    bullet_type = 'FAST'
-                elif self.type == 'WARPER': 
-                    bullet_type = 'HOMING'
-                enemy_bullets.append(EnemyBullet(self.pos, bullet_type))
-                self.fire_cooldown = self.fire_rate
         else:
             self.pos[2] -= 15 
-            
+            if self.pos[2] < self.target_z:
+                self.start_timers()
+
+    def start_timers(self):
+        # Called on the tick it arrives (before timers.advance()), and the
+        # countdowns only start on the next one
+        self.fire_timer = timers.schedule(self.fire_cooldown + 1, self.fire)
+        if self.type == 'WARPER':
+            self.warp_timer = timers.schedule(self.warp_cooldown + 1, self.warp)
+
+    def stop_timers(self):
+        if self.fire_timer is not None:
+            self.fire_cooldown = ticks_left(self.fire_timer)
+        timers.cancel(self.fire_timer)
+        timers.cancel(self.warp_timer)
+        self.fire_timer = self.warp_timer = None
+
+    def fire(self):
+        if self.type == 'GUARDIAN': 
+            bullet_type = 'BIG'
+        elif self.type == 'GRUNT': 
+            bullet_type = 'FAST'
+        elif self.type == 'WARPER': 
+            bullet_type = 'HOMING'
+        enemy_bullets.append(enemy_bullet_pool.acquire(self.pos, bullet_type))
+        self.fire_timer = timers.schedule(self.fire_rate, self.fire)
+
+    def warp(self):
+        # Flies back in from the far end; its shots wait until it arrives again
+        self.stop_timers()
+        pos_x=random.uniform(-ARENA_WIDTH*0.8, ARENA_WIDTH*0.8)
+        pos_y=random.uniform(-ARENA_HEIGHT*0.8, ARENA_HEIGHT*0.8)
+        self.pos = [pos_x, pos_y , ARENA_DEPTH]
+        target_registry.move(self)
+        self.warp_cooldown = 2500
 
     def damage(self, amount):
         global current_score
@@ -464,6 +1216,9 @@ class Enemy:
             self.health -= amount
         if self.health <= 0: 
             self.alive = False
+            self.stop_timers()
+            target_registry.unregister(self)
+            particles.burst(self.pos, 16, 6, self.radius * 0.25, 30, self.color)
             current_score += self.score_value 
             gain_experience(self.xp_value)
      
@@ -471,8 +1226,11 @@ class Enemy:
     def draw(self):
         if not self.alive: 
             return
+        level = select_lod(self.pos, self.radius)
         glPushMatrix() 
         glTranslatef(self.pos[0], self.pos[1], self.pos[2])
+        # The models are built at radius 1 (see build_mesh_cache)
+        glScalef(self.radius, self.radius, self.radius)
 
         # Hit Flash Logic
         color_rendered = self.color
@@ -480,79 +1238,24 @@ class Enemy:
             color_rendered = (0.5, 1, 0.5) # Bright Green 
 
         # Draw Model using the chosen color
+        glColor3f(color_rendered[0],color_rendered[1],color_rendered[2])
         if self.type == 'GRUNT':
-            # Body
-            glColor3f(color_rendered[0],color_rendered[1],color_rendered[2])
-            glPushMatrix() 
-            glScalef(1, 0.4, 1) 
-            gluSphere(gluNewQuadric(), self.radius, 16, 8) 
-            glPopMatrix()
-            # Cockpit
-            glPushMatrix() 
-            glTranslatef(0, self.radius * 0.2, 0) 
-            glColor3f(0.6, 0.6, 0.8) 
-            gluSphere(gluNewQuadric(), self.radius * 0.4, 12, 6) 
-            glPopMatrix()
+            draw_mesh('grunt_body', level)
+            draw_mesh('grunt_cockpit', level)
         
         elif self.type == 'GUARDIAN':
-            glColor3f(color_rendered[0],color_rendered[1],color_rendered[2])
-            
-            # Middle Cube
-            glPushMatrix() 
-            glScalef(1.2, 1, 1) 
-            glutSolidCube(self.radius * 0.8) 
-            glPopMatrix()
-            
-            # Dark Cannons
-            # Cannon 1
-            glColor3f(0.3, 0.3, 0.3) 
-            glPushMatrix() 
-            glTranslatef(self.radius * 0.6, 0, 0) 
-            gluCylinder(gluNewQuadric(), self.radius*0.2, self.radius*0.2, self.radius * 0.5, 8, 1) 
-            glPopMatrix()
-            # Cannon 2
-            glPushMatrix() 
-            glTranslatef(-self.radius * 0.6, 0, 0) 
-            gluCylinder(gluNewQuadric(), self.radius*0.2, self.radius*0.2, self.radius * 0.5, 8, 1) 
-            glPopMatrix()
+            draw_mesh('guardian_block', level)
+            draw_mesh('guardian_cannons', level)
         
         elif self.type == 'WARPER':
-            # Main Cube
-            glColor3f(color_rendered[0],color_rendered[1],color_rendered[2]) 
             glRotatef(game_time, 0.5, 1, 0.3) 
-            glutSolidCube(self.radius) 
-            
-            glColor3f(0.8, 0.8, 0.2)
-
-            # Side Rotating parts
-            glPushMatrix() 
-            glTranslatef(0, 0, self.radius*0.5) 
-            glScalef(0.1, 0.1, 1.5) 
-            glutSolidCube(self.radius) 
-            glPopMatrix()
-            
-            glPushMatrix() 
-            glTranslatef(0, 0, -self.radius*0.5) 
-            glScalef(0.1, 0.1, 1.5) 
-            glutSolidCube(self.radius) 
-            glPopMatrix()
-            
-            glPushMatrix() 
-            glTranslatef(self.radius*0.5, 0, 0) 
-            glScalef(1.5, 0.1, 0.1) 
-            glutSolidCube(self.radius) 
-            glPopMatrix()
-            
-            glPushMatrix() 
-            glTranslatef(-self.radius*0.5, 0, 0) 
-            glScalef(1.5, 0.1, 0.1) 
-            glutSolidCube(self.radius) 
-            glPopMatrix()
+            draw_mesh('warper_cube', level)
+            draw_mesh('warper_arms', level)
 
         if self.type == 'GUARDIAN' and self.shield_health > 0:
             pulse = 0.7 + 0.2 * math.sin(game_time * 0.1)
             glColor3f(NEON_CYAN[0]*pulse, NEON_CYAN[1]*pulse, NEON_CYAN[2]*pulse)
-            gluSphere(gluNewQuadric(), self.radius, 16, 12)
+            draw_mesh('guardian_shield', level)
         glPopMatrix()
 
 class Boss:
@@ -564,8 +1267,11 @@ class Boss:
     - TELEGRAPH_*: shows warning effects before attacking.
     - SWEEPING: fires a sweeping bullet pattern.
     - ASTEROID: launches asteroid attacks.
-    - WALL_ATTACK: spawns horizontal wall bullets with a moving gap.
+    - WALL_ATTACK: sends rows of the wall hazard with a moving gap at the player.
     - VULNERABLE: temporarily weak to extra damage.
+    Each state but ENTERING lasts a set number of ticks; ai_timer is the
+    TimerWheel timer that ends it, so update() only does the per-tick
+    movement and firing of the current state.
     """
 
     def __init__(self):
@@ -578,15 +1284,15 @@ class Boss:
 
         # --- Positioning ---
         self.pos = [0, 0, ARENA_DEPTH + 300]
+        self.prev_pos = None
         self.target_pos = [0, 0, ARENA_DEPTH - 800]
 
         # --- State Flags ---
         self.alive = True
         self.phase = 1
         self.ai_state = "ENTERING"
-        self.ai_timer = 0
+        self.ai_timer = None
         self.sweep_angle = -90
-        self.charge_particles = []
         self.flash_timer = 0
 
         # --- Wall Attack Variables (NEW) ---
@@ -611,23 +1317,83 @@ class Boss:
         # Phase 2
         if self.phase == 1 and self.health <= self.max_health / 2:
             self.phase = 2
-            self.ai_state = "IDLE"
-            self.ai_timer = 120
+            self.set_state("IDLE", 120 / time_scale)
 
         # Boss death
         if self.health <= 0:
             self.alive = False
+            self.stop_timers()
+            target_registry.unregister(self)
             current_score += 5000
             gain_experience(200)
             skill_points += 3
-            enemies.clear()
-            enemy_bullets.clear()
-            asteroids.clear()
+            clear_enemies()
+            clear_projectiles(enemy_bullets, enemy_bullet_pool)
+            clear_projectiles(asteroids)
+            wall_hazard.clear()
             spawn_obstacles(15)
             game_state = "WAVE_TRANSITION"
             wave_transition_timer = WAVE_TRANSITION_DURATION
             trigger_camera_shake(200, 60)
 
+    def set_state(self, state, ticks):
+        """Switches the AI to state and schedules its end after ticks (rounded up to whole ticks)."""
+        timers.cancel(self.ai_timer)
+        self.ai_state = state
+        self.ai_timer = timers.schedule(ticks, self.end_state)
+
+    def stop_timers(self):
+        timers.cancel(self.ai_timer)
+        self.ai_timer = None
+
+    def end_state(self):
+        """Runs when the current state's time is up (during timers.advance()) and picks the next one."""
+        if self.ai_state == "IDLE":
+            chance = random.random()
+            if chance < 0.4:
+                self.set_state("TELEGRAPH_WALL", 150 / time_scale)
+            elif chance < 0.7:
+                self.set_state("TELEGRAPH_ASTEROID", 200)
+            else:
+                self.set_state("TELEGRAPH_SWEEP", 120)
+
+        elif self.ai_state == "TELEGRAPH_ASTEROID":
+            self.set_state("ASTEROID", 300)
+
+        elif self.ai_state == "TELEGRAPH_SWEEP":
+            self.set_state("SWEEPING", 1800)
+
+        elif self.ai_state == "TELEGRAPH_WALL":
+            # Set up the moving gap wall attack
+            self.gap_pos_x = random.uniform(-ARENA_WIDTH / 2, ARENA_WIDTH / 2)
+            self.gap_width = 75
+            self.gap_direction = random.choice([-1, 1])
+            self.set_state("WALL_ATTACK", 240 / time_scale)  # total attack duration
+            self.wall_spawn_timer = 40  # spawns rows for 40 frames
+
+        elif self.ai_state == "SWEEPING":
+            self.pos[0] = 0
+            target_registry.move(self)
+            self.set_state("VULNERABLE", 600)
+
+        elif self.ai_state == "ASTEROID":
+            asteroids.append(Asteroid(self.pos))
+            for _ in range(4):
+                offset = [random.uniform(-200, 200), random.uniform(-150, 150), 0]
+                target_pos = [
+                    player_pos[0] + offset[0],
+                    player_pos[1] + offset[1],
+                    player_pos[2]
+                ]
+                asteroids.append(Asteroid(self.pos, target_pos=target_pos))
+            self.set_state("VULNERABLE", 300)
+
+        elif self.ai_state == "WALL_ATTACK":
+            self.set_state("VULNERABLE", 240)
+
+        elif self.ai_state == "VULNERABLE":
+            self.set_state("IDLE", 120 / time_scale)
+
     def update(self):
         """Main AI state machine controlling the boss's behavior."""
         if not self.alive:
@@ -637,78 +1403,33 @@ class Boss:
         if self.flash_timer > 0:
             self.flash_timer -= 1
 
-        # Charge particles (telegraph visuals)
-        for p in self.charge_particles[:]:
-            p['size'] += p['rate']
-            p['timer'] -= 1
-            if p['timer'] <= 0:
-                self.charge_particles.remove(p)
-
         # --- AI State Machine ---
         if self.ai_state == "ENTERING":
             self.pos[2] -= 5 * time_scale
             if self.pos[2] <= self.target_pos[2]:
-                self.ai_state = "IDLE"
-                self.ai_timer = 120
-
-        elif self.ai_state == "IDLE":
-            self.ai_timer -= 1 * time_scale
-            if self.ai_timer <= 0:
-                chance = random.random()
-                if chance < 0.4:
-                    self.ai_state = "TELEGRAPH_WALL"
-                    self.ai_timer = 150
-                elif chance < 0.7:
-                    self.ai_state = "TELEGRAPH_ASTEROID"
-                    self.ai_timer = 200
-                else:
-                    self.ai_state = "TELEGRAPH_SWEEP"
-                    self.ai_timer = 120
+                # Called before timers.advance(), so the countdown starts on the next tick
+                self.set_state("IDLE", 120 / time_scale + 1)
 
         # --- Telegraph States ---
         elif self.ai_state == "TELEGRAPH_ASTEROID":
-            self.ai_timer -= 1
-            if self.ai_timer % 5 == 0:
-                self.charge_particles.append({
-                    'pos': [random.uniform(-50, 50), random.uniform(-50, 50), 0],
-                    'size': 3,
-                    'rate': 1.5,
-                    'timer': 15,
-                    'color': ASTEROID_GREY
-                })
-            if self.ai_timer <= 0:
-                self.ai_state = "ASTEROID"
-                self.ai_timer = 300
-
-        elif self.ai_state == "TELEGRAPH_SWEEP":
-            self.ai_timer -= 1
-            if self.ai_timer <= 0:
-                self.ai_state = "SWEEPING"
-                self.ai_timer = 1800
-
-        elif self.ai_state == "TELEGRAPH_WALL":
-            self.ai_timer -= 1 * time_scale
-            if self.ai_timer <= 0:
-                # Set up the moving gap wall attack
-                self.ai_state = "WALL_ATTACK"
-                self.gap_pos_x = random.uniform(-ARENA_WIDTH / 2, ARENA_WIDTH / 2)
-                self.gap_width = 75
-                self.gap_direction = random.choice([-1, 1])
-                self.ai_timer = 240  # total attack duration
-                self.wall_spawn_timer = 40  # spawns rows for 40 frames
+            # Ticks the state has left after this one
+            if (ticks_left(self.ai_timer) - 1) % 5 == 0:
+                # Charge particles (telegraph visuals) swelling around the core
+                offset_x, offset_y = random.uniform(-50, 50), random.uniform(-50, 50)
+                particles.emit([self.pos[0] + offset_x, self.pos[1] + offset_y, self.pos[2]],
+                               (0, 0, 0), 3, 1.5, 15, ASTEROID_GREY)
 
         # --- Attack States ---
         elif self.ai_state == "SWEEPING":
-            self.ai_timer -= 1
             self.pos[0] = math.sin(game_time * 0.02 * time_scale) * 200
-            if self.ai_timer % 3 == 0:
+            if (ticks_left(self.ai_timer) - 1) % 3 == 0:
                 angle_rad = math.radians(self.sweep_angle)
                 start_pos = [
                     self.pos[0] + math.cos(angle_rad) * self.radius,
                     self.pos[1] + math.sin(angle_rad) * self.radius,
                     self.pos[2]
                 ]
-                bullet = EnemyBullet(start_pos, 'BIG')
+                bullet = enemy_bullet_pool.acquire(start_pos, 'BIG')
                 bullet.speed *= 2.5
                 bullet.vector[1] += random.uniform(-0.1, 0.1)
                 enemy_bullets.append(bullet)
@@ -716,29 +1437,8 @@ class Boss:
                     self.sweep_angle += 0.5 
                 else:
                     self.sweep_angle += 0.75
-            if self.ai_timer <= 0:
-                self.pos[0] = 0
-                self.ai_state = "VULNERABLE"
-                self.ai_timer = 600
-
-        elif self.ai_state == "ASTEROID":
-            self.ai_timer -= 1
-            if self.ai_timer <= 0:
-                asteroids.append(Asteroid(self.pos))
-                for _ in range(4):
-                    offset = [random.uniform(-200, 200), random.uniform(-150, 150), 0]
-                    target_pos = [
-                        player_pos[0] + offset[0],
-                        player_pos[1] + offset[1],
-                        player_pos[2]
-                    ]
-                    asteroids.append(Asteroid(self.pos, target_pos=target_pos))
-                self.ai_state = "VULNERABLE"
-                self.ai_timer = 300
 
         elif self.ai_state == "WALL_ATTACK":
-            self.ai_timer -= 1 * time_scale
-
             # Move the safe gap horizontally during attack
             gap_speed = 8 * time_scale
             self.gap_pos_x += self.gap_direction * gap_speed
@@ -755,42 +1455,19 @@ class Boss:
                 progress = self.wall_spawn_timer / 40
                 y_offset = -200 + (1 - progress) * 400
 
-                # Instead of dozens of small bullets, we place ~6 large bullets
-                num_columns = 10  # drastically fewer
-                spacing = ARENA_WIDTH / num_columns
-
-                for i in range(num_columns):
-                    x = -ARENA_WIDTH / 2 + i * spacing + spacing / 2
-                    
-                    # Skip the safe gap
-                    if abs(x - self.gap_pos_x) < self.gap_width:
-                        continue
-                    
-                    start_pos = [x, player_pos[1] + y_offset, self.pos[2]]
-                    bullet = EnemyBullet(start_pos, 'WALL')
-                    bullet.speed *= 1.5
-                    
-                    # Make wall bullets visually larger & cover more space
-                    bullet.radius = 40
-                    
-                    enemy_bullets.append(bullet)
-
-            if self.ai_timer <= 0:
-                self.ai_state = "VULNERABLE"
-                self.ai_timer = 240
+                # One row of large spheres across the arena, minus the gap
+                wall_hazard.spawn_row(player_pos[1] + y_offset, self.pos[2], self.gap_pos_x, self.gap_width,
+                                      1.7 * enemy_bullet_speed_multiplier * 1.5)
 
         elif self.ai_state == "VULNERABLE":
             self.pos[0] *= 0.95
             self.pos[1] *= 0.95
-            self.ai_timer -= 1
-            if self.ai_timer <= 0:
-                self.ai_state = "IDLE"
-                self.ai_timer = 120
 
     def draw(self):
         """Draw the boss model and its telegraph effects."""
         if not self.alive:
             return
+        level = select_lod(self.pos, self.radius)
         glPushMatrix()
         glTranslatef(self.pos[0], self.pos[1], self.pos[2])
 
@@ -813,35 +1490,308 @@ class Boss:
             core_color = (0.5, 1, 0.5)
             self.ring_color = (0.5, 1, 0.5)
 
-        # --- Draw body ---
+        # --- Draw body (models are built at radius 1) ---
+        glPushMatrix()
+        glScalef(self.radius, self.radius, self.radius)
         pulse = 0.5 + 0.5 * math.sin(game_time * 0.2)
         glColor3f(core_color[0] * pulse, core_color[1] * pulse, core_color[2] * pulse)
-        gluSphere(gluNewQuadric(), self.radius * 0.6, 16, 12)
+        draw_mesh('boss_core', level)
 
         # --- Draw rotating rings ---
         glColor3f(*self.ring_color)
         glPushMatrix()
         glRotatef(game_time, 1, 1, 1)
-        glScalef(1, 1, 0.2)
-        glutSolidCube(self.radius * 2)
+        draw_mesh('boss_ring_flat', level)
         glPopMatrix()
 
         glPushMatrix()
         glRotatef(game_time, -1, 1, -1)
-        glScalef(0.2, 1, 1)
-        glutSolidCube(self.radius * 2)
+        draw_mesh('boss_ring_tall', level)
+        glPopMatrix()
         glPopMatrix()
-
-        # --- Draw charge particles ---
-        for p in self.charge_particles:
-            glPushMatrix()
-            glTranslatef(p['pos'][0], p['pos'][1], p['pos'][2])
-            glColor3f(*p['color'])
-            gluSphere(gluNewQuadric(), p['size'], 6, 6)
-            glPopMatrix()
 
         glPopMatrix()
 
+class SpatialHash:
+    """
+    Uniform grid used as the collision broadphase.
+    Items are inserted with a center and a half extent and end up in every
+    cell their box touches. query() returns the items sharing a cell with a
+    sphere, so only nearby pairs reach the exact (narrow-phase) tests.
+    Cells are kept in a dict, so things outside the arena (like the boss
+    flying in) need no special casing.
+    """
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def cell_range(self, low, high):
+        return range(int(low // self.cell_size), int(high // self.cell_size) + 1)
+
+    def insert(self, item, center, half_extent):
+        ys = self.cell_range(center[1] - half_extent, center[1] + half_extent)
+        zs = self.cell_range(center[2] - half_extent, center[2] + half_extent)
+        for ix in self.cell_range(center[0] - half_extent, center[0] + half_extent):
+            for iy in ys:
+                for iz in zs:
+                    cell = (ix, iy, iz)
+                    if cell in self.cells:
+                        self.cells[cell].append(item)
+                    else:
+                        self.cells[cell] = [item]
+
+    def query(self, center, radius):
+        found = set()
+        ys = self.cell_range(center[1] - radius, center[1] + radius)
+        zs = self.cell_range(center[2] - radius, center[2] + radius)
+        for ix in self.cell_range(center[0] - radius, center[0] + radius):
+            for iy in ys:
+                for iz in zs:
+                    bucket = self.cells.get((ix, iy, iz))
+                    if bucket:
+                        found.update(bucket)
+        return found
+
+class ObstacleIndex:
+    """
+    Cached lookup table over the obstacle boxes.
+    Obstacles never move: they only change when spawn_obstacles() runs or
+    when one is destroyed or respawns, and those are the only places that
+    call invalidate(). The table is rebuilt lazily on the next query.
+    Live obstacles are sorted by the near edge of their box along z, so a
+    query only looks at the few boxes whose z-interval can reach it.
+    """
+    def __init__(self):
+        self.dirty = True
+        self.z_starts = []
+        self.entries = []
+        self.max_size = 0
+        self.rebuilds = 0
+
+    def invalidate(self):
+        self.dirty = True
+
+    def rebuild(self):
+        live = [(obstacle.pos[2] - obstacle.size/2, i, obstacle) for i, obstacle in enumerate(obstacles) if obstacle.alive]
+        live.sort(key=lambda entry: entry[0])
+        self.z_starts = [z_start for z_start, _, _ in live]
+        self.entries = [(i, obstacle) for _, i, obstacle in live]
+        self.max_size = max([obstacle.size for _, obstacle in self.entries], default=0)
+        # Aim-assist hitboxes for fire_weapon(), which only locks on to shootable boxes
+        self.shootable = [obstacle for _, obstacle in self.entries if obstacle.type == 'Shootable']
+        self.shootable_centers = [list(obstacle.pos) for obstacle in self.shootable]
+        self.shootable_radii = [obstacle.size * 0.75 for obstacle in self.shootable]
+        if np is not None:
+            self.shootable_centers = np.array(self.shootable_centers, dtype=float).reshape(-1, 3)
+            self.shootable_radii = np.array(self.shootable_radii, dtype=float)
+        self.dirty = False
+        self.rebuilds += 1
+
+    def find_hit(self, pos, radius):
+        """Returns the first obstacle (in list order) whose box touches the sphere, or None."""
+        if self.dirty:
+            self.rebuild()
+        first = bisect_left(self.z_starts, pos[2] - radius - self.max_size)
+        last = bisect_right(self.z_starts, pos[2] + radius)
+        hit_index, hit = None, None
+        for k in range(first, last):
+            i, obstacle = self.entries[k]
+            if hit is not None and i > hit_index:
+                continue
+            # Simple sphere vs cube (AABB) check
+            reach = obstacle.size/2 + radius
+            if (abs(pos[0] - obstacle.pos[0]) < reach and
+                abs(pos[1] - obstacle.pos[1]) < reach and
+                abs(pos[2] - obstacle.pos[2]) < reach):
+                hit_index, hit = i, obstacle
+        return hit
+
+    def find_swept_hit(self, start, end, radius):
+        """
+        Sweeps a sphere from start to end and returns (t, obstacle) for the
+        first box it touches, t being the fraction of the path travelled.
+        Ties go to the obstacle earliest in the list. (None, None) on a miss.
+        """
+        if self.dirty:
+            self.rebuild()
+        first = bisect_left(self.z_starts, min(start[2], end[2]) - radius - self.max_size)
+        last = bisect_right(self.z_starts, max(start[2], end[2]) + radius)
+        hit_time, hit_index, hit = None, None, None
+        for k in range(first, last):
+            i, obstacle = self.entries[k]
+            t = segment_box_time(start, end, obstacle.pos, obstacle.size/2 + radius)
+            if t is None:
+                continue
+            if hit is None or t < hit_time or (t == hit_time and i < hit_index):
+                hit_time, hit_index, hit = t, i, obstacle
+        return hit_time, hit
+
+obstacle_index = ObstacleIndex()
+
+def closest_on_ray(centers, radii, origin, direction):
+    """
+    Index and squared distance of the sphere nearest origin among those the
+    (unit) ray passes through; (None, inf) if it misses them all. Ties go
+    to the lowest index.
+    """
+    if np is not None:
+        if len(radii) == 0:
+            return None, float('inf')
+        to_target = centers - origin
+        along = to_target @ direction
+        dist_sq = (to_target * to_target).sum(axis=1)
+        # Squared distance from each center to its closest point on the ray
+        off_ray_sq = dist_sq - along * along
+        hit = (along >= 0) & (off_ray_sq < radii * radii)
+        if not hit.any():
+            return None, float('inf')
+        dist_sq = np.where(hit, dist_sq, np.inf)
+        index = int(np.argmin(dist_sq))
+        return index, float(dist_sq[index])
+
+    closest, closest_dist_sq = None, float('inf')
+    for index, (center, radius) in enumerate(zip(centers, radii)):
+        dx, dy, dz = center[0] - origin[0], center[1] - origin[1], center[2] - origin[2]
+        along = dx*direction[0] + dy*direction[1] + dz*direction[2]
+        if along < 0:
+            continue
+        dist_sq = dx*dx + dy*dy + dz*dz
+        if dist_sq - along * along < radius * radius and dist_sq < closest_dist_sq:
+            closest, closest_dist_sq = index, dist_sq
+    return closest, closest_dist_sq
+
+class TargetRegistry:
+    """
+    Everything fire_weapon() can lock on to, with hitbox centers and radii
+    kept in arrays (lists without NumPy) so the aiming ray is tested against
+    all of them at once.
+    Enemies and the boss get a row when they spawn, and lose it when they
+    die or are removed: the last row moves into the freed one. move() copies
+    an entity's position into its row whenever it has moved, so a pick only
+    reads the arrays, never the entities. Shootable obstacles come from
+    obstacle_index, which already caches them until one is destroyed or
+    respawns.
+    """
+    def __init__(self):
+        self.entities = []
+        self.rows = {}
+        if np is not None:
+            self.centers = np.zeros((16, 3))
+            self.radii = np.zeros(16)
+        else:
+            self.centers, self.radii = [], []
+
+    def register(self, entity):
+        if entity in self.rows:
+            return
+        row = len(self.entities)
+        self.rows[entity] = row
+        self.entities.append(entity)
+        if np is not None:
+            if row == len(self.radii):
+                self.centers = np.concatenate((self.centers, np.zeros_like(self.centers)))
+                self.radii = np.concatenate((self.radii, np.zeros_like(self.radii)))
+            self.centers[row] = entity.pos
+            self.radii[row] = entity.radius
+        else:
+            self.centers.append(list(entity.pos))
+            self.radii.append(entity.radius)
+
+    def unregister(self, entity):
+        row = self.rows.pop(entity, None)
+        if row is None:
+            return
+        last = len(self.entities) - 1
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved] = row
+            self.centers[row] = self.centers[last]
+            self.radii[row] = self.radii[last]
+        self.entities.pop()
+        if np is None:
+            self.centers.pop()
+            self.radii.pop()
+
+    def move(self, entity):
+        row = self.rows.get(entity)
+        if row is None:
+            return
+        if np is not None:
+            self.centers[row] = entity.pos
+        else:
+            self.centers[row] = list(entity.pos)
+
+    def clear(self):
+        self.entities.clear()
+        self.rows.clear()
+        if np is None:
+            self.centers.clear()
+            self.radii.clear()
+
+    def pick(self, origin, direction):
+        """Returns the target nearest to origin whose hitbox the (unit) ray passes through, or None."""
+        if obstacle_index.dirty:
+            obstacle_index.rebuild()
+        count = len(self.entities)
+        entity_row, entity_dist_sq = closest_on_ray(self.centers[:count], self.radii[:count], origin, direction)
+        obstacle_row, obstacle_dist_sq = closest_on_ray(obstacle_index.shootable_centers, obstacle_index.shootable_radii,
+                                                        origin, direction)
+        # Enemies and the boss win ties, as they did when everything was tested in one list
+        if obstacle_row is not None and obstacle_dist_sq < entity_dist_sq:
+            return obstacle_index.shootable[obstacle_row]
+        if entity_row is not None:
+            return self.entities[entity_row]
+        return None
+
+target_registry = TargetRegistry()
+
+# --- Swept Tests ---
+# Lasers cover up to 90 units per tick but are only 3.5 units wide, so
+# testing where they end up lets them tunnel through thin boxes and small
+# enemies. These test the segment a point (or a sphere, by growing the
+# target) travelled instead, and return the fraction t in [0, 1] of the way
+# along it where the first contact happens, or None if there is none.
+
+def segment_sphere_time(start, end, center, radius):
+    """Segment vs sphere: solves |start + d*t - center| = radius for the smallest t."""
+    dx, dy, dz = end[0] - start[0], end[1] - start[1], end[2] - start[2]
+    fx, fy, fz = start[0] - center[0], start[1] - center[1], start[2] - center[2]
+    c = fx*fx + fy*fy + fz*fz - radius*radius
+    if c < 0:
+        return 0.0  # Already overlapping at the start
+    a = dx*dx + dy*dy + dz*dz
+    if a == 0:
+        return None
+    b = fx*dx + fy*dy + fz*dz
+    discriminant = b*b - a*c
+    if b >= 0 or discriminant < 0:
+        return None  # Moving away, or the line misses the sphere
+    t = (-b - math.sqrt(discriminant)) / a
+    return t if t <= 1 else None
+
+def segment_box_time(start, end, center, half_size):
+    """Segment vs cube (AABB) with the slab method: clips the segment against each axis in turn."""
+    t_enter, t_exit = 0.0, 1.0
+    for axis in range(3):
+        origin = start[axis]
+        delta = end[axis] - origin
+        low, high = center[axis] - half_size, center[axis] + half_size
+        if delta == 0:
+            if origin <= low or origin >= high:
+                return None
+            continue
+        t_low, t_high = (low - origin) / delta, (high - origin) / delta
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        t_enter, t_exit = max(t_enter, t_low), min(t_exit, t_high)
+        if t_enter >= t_exit:
+            return None
+    return t_enter
+
 # =============================
 # Game Logic
 # =============================
@@ -908,24 +1858,18 @@ def activate_temp_skill(skill_name):
     if skill_points >= skill["cost"] and not skill["active"]:
         skill_points -= skill["cost"]
         skill["active"] = True
-        skill["duration"] = 120 * 60  # 2 mins in frames (if 60 FPS)
+        skill["timer"] = timers.schedule(120 * 60, end_temp_skill, skill)  # 2 mins in frames (if 60 FPS)
         return True
     return False
 
-
-def update_temp_skills():
-    """Reduce duration of temporary skills each frame."""
-    for skill in temp_skills.values():
-        if skill["active"]:
-            skill["duration"] -= 1
-            if skill["duration"] <= 0:
-                skill["active"] = False
+def end_temp_skill(skill):
+    skill["active"] = False
 
 
 def get_evade_cost():
     return max(15, stamina_evade_cost - (skill_stamina_efficiency * 5))
 def can_evade():
-    return stamina_level >= get_evade_cost() and evade_cooldown <= 0
+    return stamina_level >= get_evade_cost() and ticks_left(evade_cooldown) <= 0
 def consume_evade_stamina():
     global stamina_level
     stamina_level -= get_evade_cost()
@@ -956,13 +1900,17 @@ def activate_special_ability():
         return
     special_ability_active = True
     durations = {"TIME_SLOW": 3600, "SHIELD_BUBBLE": 3600, "DAMAGE_BOOST": 3600 }
-    special_ability_timer = durations.get(current_special, 3600) 
+    special_ability_timer = timers.schedule(durations.get(current_special, 3600), end_special_ability)
     special_ability_meter = 0
-def update_special_ability():
-    global special_ability_active, special_ability_timer
-    if special_ability_active and special_ability_timer > 0:
-        special_ability_timer -= 1
-        if special_ability_timer <= 0: special_ability_active = False
+def end_special_ability():
+    global special_ability_active
+    special_ability_active = False
+def end_mobility_boost():
+    global mobility_boost_active
+    mobility_boost_active = False
+def end_weapon_mastery():
+    global weapon_mastery_active
+    weapon_mastery_active = False
 def cycle_special_ability():
     global current_special, SPECIAL_ABILITIES
     idx = (SPECIAL_ABILITIES.index(current_special) + 1) % len(SPECIAL_ABILITIES) 
@@ -972,15 +1920,41 @@ def start_next_wave():
     current_wave += 1
     if current_wave > 0 and current_wave % 5 == 0:
         boss = Boss()
+        target_registry.register(boss)
     else:
         enemies_per_wave = min(10, 2 + (current_wave - 1) // 2)
         enemy_bullet_speed_multiplier = min(3, 1+ (current_wave - 1) * 0.1)
         for _ in range(enemies_per_wave):
             spawn_enemy()
 def spawn_enemy():
-    if len(enemies) < max_enemies: enemies.append(Enemy())
+    if len(enemies) < max_enemies:
+        enemy = Enemy()
+        enemies.append(enemy)
+        target_registry.register(enemy)
+
+def despawn_enemy(enemy):
+    """Takes an enemy that is leaving the game off the target registry and cancels its timers."""
+    enemy.stop_timers()
+    target_registry.unregister(enemy)
+
+def clear_enemies():
+    """Removes every enemy at once (wave cleared or game left)."""
+    for enemy in enemies:
+        despawn_enemy(enemy)
+    enemies.clear()
+
+def clear_boss():
+    """Removes the boss (game left), cancelling its AI timer."""
+    global boss
+    if boss:
+        boss.stop_timers()
+        target_registry.unregister(boss)
+    boss = None
 def spawn_obstacles(count):
     global obstacles
+    # The old layout's pending respawns go with it
+    for obstacle in obstacles:
+        timers.cancel(obstacle.respawn_timer)
     obstacles = []
     for _ in range(count):
         size = random.uniform(40, 150)
@@ -994,96 +1968,122 @@ def spawn_obstacles(count):
         else:
             type = 'not_Shootable'
         obstacles.append(Obstacle(pos, size, type))
+    obstacle_index.invalidate()
+
+def compact_dead(entities, on_remove=None):
+    """
+    Removes dead entities from a list in a single pass (instead of one
+    list.remove() per dead entity), calling on_remove for each one dropped.
+    Survivors keep their relative order, so order-dependent rules like the
+    hit priority in check_collisions() play out exactly as before.
+    """
+    if DEBUG_COMPACTION:
+        expected = [entity for entity in entities if entity.alive]
+    write = 0
+    for entity in entities:
+        if entity.alive:
+            entities[write] = entity
+            write += 1
+        elif on_remove is not None:
+            on_remove(entity)
+    del entities[write:]
+    if DEBUG_COMPACTION:
+        assert len(entities) == len(expected) and all(a is b for a, b in zip(entities, expected)), \
+            "compact_dead() changed which entities survive or their order"
 
 def update_enemies_and_bullets():
-    if boss and boss.alive: boss.update()
-    for enemy in enemies[:]:
-        if not enemy.alive: enemies.remove(enemy)
-        else: enemy.update()
-    for bullet in enemy_bullets[:]:
-        if not bullet.alive: enemy_bullets.remove(bullet)
-        else: bullet.update()
-    for asteroid in asteroids[:]:
-        if not asteroid.alive: asteroids.remove(asteroid)
-        else: asteroid.update()
-    # --- Update and clean up obstacles ---
-    for obstacle in obstacles[:]:
-        obstacle.update()
+    particles.update()
+    if boss and boss.alive:
+        boss.update()
+        target_registry.move(boss)
+    compact_dead(enemies, despawn_enemy)
+    for enemy in enemies:
+        enemy.update()
+        target_registry.move(enemy)
+    # Timers run out here, once the enemies have moved and before the
+    # new enemy projectiles take their first step
+    timers.advance()
+    compact_dead(enemy_bullets, enemy_bullet_pool.recycle)
+    EnemyBullet.update_all()
+    wall_hazard.update()
+    compact_dead(asteroids, Asteroid.release)
+    Asteroid.update_all()
+# Broadphase layers, in the order check_collisions() has always tested them
+ENEMY_LAYER, BOSS_LAYER = 0, 1
+collision_grid = SpatialHash(BROADPHASE_CELL_SIZE)
+
+def build_collision_grid():
+    """Bins the moving targets (enemies and the boss) into the broadphase grid for this tick."""
+    collision_grid.clear()
+    for i, enemy in enumerate(enemies):
+        if enemy.alive:
+            collision_grid.insert((ENEMY_LAYER, i, enemy), enemy.pos, enemy.radius)
+    if boss and boss.alive:
+        collision_grid.insert((BOSS_LAYER, 0, boss), boss.pos, boss.radius)
+
 def check_collisions():
     global player_health,player_flash_timer
-    for bullet in bullets[:]:
+    build_collision_grid()
+    for bullet in bullets:
         if not bullet.alive: continue
+        # Lasers are tested along the whole path they covered this tick,
+        # and whatever the path reaches first takes the hit
+        start, end = bullet.prev_pos, bullet.pos
         # OBSTACLE COLLISION
-        for obstacle in obstacles:
-            if not obstacle.alive: continue
-            # Simple sphere vs cube (AABB) check
-            if (abs(bullet.pos[0] - obstacle.pos[0]) < obstacle.size/2 + bullet.radius and
-                abs(bullet.pos[1] - obstacle.pos[1]) < obstacle.size/2 + bullet.radius and
-                abs(bullet.pos[2] - obstacle.pos[2]) < obstacle.size/2 + bullet.radius):
-                
-                if obstacle.type == 'Shootable':
-                    obstacle.damage(bullet.damage)
-                bullet.alive = False
-                break
-        if not bullet.alive: continue
-        # ENEMY COLLISION 
-        for enemy in enemies:
-            if not enemy.alive: continue
-            dist_sq = (bullet.pos[0] - enemy.pos[0])**2 + (bullet.pos[1] - enemy.pos[1])**2 + (bullet.pos[2] - enemy.pos[2])**2
-            if dist_sq < (bullet.radius + enemy.radius)**2:
-                enemy.damage(bullet.damage)
-                bullet.alive = False
-                break
-     
-        # BOSS COLLISION
-        if not bullet.alive: continue 
-        if boss and boss.alive:
-            dist_sq = (bullet.pos[0] - boss.pos[0])**2 + (bullet.pos[1] - boss.pos[1])**2 + (bullet.pos[2] - boss.pos[2])**2
-            if dist_sq < (bullet.radius + boss.radius)**2:
-                boss.damage(bullet.damage) 
-                bullet.alive = False
+        hit_time, obstacle = obstacle_index.find_swept_hit(start, end, bullet.radius)
+        # ENEMY / BOSS COLLISION
+        # Sorting keeps the old priority on ties: obstacles, then enemies (in list order), then the boss
+        middle = [(start[0] + end[0]) / 2, (start[1] + end[1]) / 2, (start[2] + end[2]) / 2]
+        reach = math.dist(start, end) / 2 + bullet.radius
+        hit_layer, hit_target = None, None
+        for layer, _, target in sorted(collision_grid.query(middle, reach)):
+            if not target.alive: continue
+            t = segment_sphere_time(start, end, target.pos, bullet.radius + target.radius)
+            if t is not None and (hit_time is None or t < hit_time):
+                hit_time, hit_layer, hit_target = t, layer, target
+        if hit_time is not None:
+            # Sparks where the laser struck
+            impact = [start[i] + (end[i] - start[i]) * hit_time for i in range(3)]
+            particles.burst(impact, 5, 3, 3, 10, ENERGY_YELLOW)
+        if hit_target is not None:
+            hit_target.damage(bullet.damage)
+            bullet.alive = False
+            # Killing the boss clears the wave (and its enemies)
+            if hit_layer == BOSS_LAYER and not hit_target.alive:
+                build_collision_grid()
+        elif obstacle is not None:
+            if obstacle.type == 'Shootable':
+                obstacle.damage(bullet.damage)
+            bullet.alive = False
 
 
     # --- Enemy Projectiles vs. Obstacles ---
     for proj in enemy_bullets:
-        if not proj.alive or proj.type=="WALL": continue
-        for obstacle in obstacles:
-            if (abs(proj.pos[0] - obstacle.pos[0]) < obstacle.size/2 + proj.radius and
-                abs(proj.pos[1] - obstacle.pos[1]) < obstacle.size/2 + proj.radius and
-                abs(proj.pos[2] - obstacle.pos[2]) < obstacle.size/2 + proj.radius):
-                proj.alive = False
-                break
+        if not proj.alive: continue
+        if obstacle_index.find_hit(proj.pos, proj.radius) is not None:
+            proj.alive = False
 
     
     # --- Player Damage  ---
 
     invincible = (special_ability_active and current_special in [ "SHIELD_BUBBLE"]) or INVINCIBLE_MODE
     if not invincible:
-            # Enemy bullets vs player
-            for bullet in enemy_bullets[:]:
-                if not bullet.alive: continue
-                dist_sq = (bullet.pos[0] - player_pos[0])**2 + (bullet.pos[1] - player_pos[1])**2 + (bullet.pos[2] - player_pos[2])**2
-                if dist_sq < (bullet.radius + player_radius)**2: 
-                    player_health -= bullet.damage 
-                    bullet.alive = False
-                    trigger_camera_shake(50, 40) 
-                    player_flash_timer = 15 
-            # Asteroids vs player
-            for asteroid in asteroids[:]:
-                if not asteroid.alive: continue
-                dist_sq = (asteroid.pos[0] - player_pos[0])**2 + (asteroid.pos[1] - player_pos[1])**2 + (asteroid.pos[2] - player_pos[2])**2
-                if dist_sq < (asteroid.radius + player_radius)**2: 
-                    player_health -= asteroid.damage 
-                    asteroid.alive = False
-                    trigger_camera_shake(25, 50) 
-                    player_flash_timer = 15 
+        # One pass per projectile kind; the hits are then applied together
+        bullet_hits, bullet_damage = enemy_bullet_store.hit_sphere(player_pos, player_radius)
+        wall_hits, wall_damage = wall_hazard.hit_sphere(player_pos, player_radius)
+        asteroid_hits, asteroid_damage = asteroid_store.hit_sphere(player_pos, player_radius)
+        # Wall pieces hurt (and shake) like enemy bullets
+        bullet_count = len(bullet_hits) + wall_hits
+        if bullet_count or len(asteroid_hits):
+            player_health -= bullet_damage + wall_damage + asteroid_damage
+            # Shakes stack, so one call with the summed values matches one call per hit
+            trigger_camera_shake(50 * bullet_count + 25 * len(asteroid_hits),
+                                 40 * bullet_count + 50 * len(asteroid_hits))
+            player_flash_timer = 15
 
 def update_bullets():
-    for bullet in bullets[:]:
-        if not bullet.alive: 
-            bullets.remove(bullet) 
-            continue
-        bullet.update()
+    compact_dead(bullets, bullet_pool.recycle)
+    Bullet.update_all()
 
 
 def load_high_scores():
@@ -1221,7 +2221,7 @@ def fire_weapon():
     global weapon_cooldown, heat_level, overheated, bullets
     
     # Don't fire if the weapon is on cooldown or has overheated.
-    if weapon_cooldown > 0 or overheated:
+    if ticks_left(weapon_cooldown) > 0 or overheated:
         return
 
     # === Step 1: Determine what the player is aiming at from the camera's view. ===
@@ -1245,50 +2245,8 @@ def fire_weapon():
 
     # === Step 2: Find the closest game object that this aiming ray intersects. ===
 
-    closest_hit_object = None
-    min_distance_to_object = float('inf')
-    
-    # Combine all potential targets into one list for easier checking.
-    if boss and boss.alive:
-        all_possible_targets = ([boss]) + enemies
-    else:
-        all_possible_targets = ([]) + enemies
-
-    all_possible_targets += [obs for obs in obstacles if obs.alive and obs.type == 'Shootable']
-
-    for target in all_possible_targets:
-        # This is a simplified ray-sphere intersection check.
-        # It determines if our aiming ray passes through the target's hitbox.
-        vector_to_target = [
-            target.pos[0] - aiming_ray_origin[0],
-            target.pos[1] - aiming_ray_origin[1],
-            target.pos[2] - aiming_ray_origin[2]
-        ]
-        
-        # Project the target's vector onto the ray's direction.
-        dot_product = sum(v * d for v, d in zip(vector_to_target, aiming_ray_direction))
-        
-        # If the dot product is negative, the target is behind the camera.
-        if dot_product < 0:
-            continue
-            
-        # Find the closest point on the ray to the target's center.
-        closest_point_on_ray = [origin + dot_product * direction for origin, direction in zip(aiming_ray_origin, aiming_ray_direction)]
-        
-        # Calculate the squared distance from the target's center to that point on the ray.
-        distance_from_target_to_ray_sq = sum((p1 - p2)**2 for p1, p2 in zip(target.pos, closest_point_on_ray))
-        
-        # Use a generic 'hitbox_radius' for checking collision.
-        hitbox_radius = getattr(target, 'radius', getattr(target, 'size', 1) * 0.75)
-
-        # If the distance is less than the hitbox radius, we have a hit!
-        if distance_from_target_to_ray_sq < hitbox_radius**2:
-            distance_from_camera = math.sqrt(sum(v**2 for v in vector_to_target))
-            
-            # Check if this hit is the closest one we've found so far.
-            if distance_from_camera < min_distance_to_object:
-                min_distance_to_object = distance_from_camera
-                closest_hit_object = target
+    # Every live enemy, the boss and shootable obstacles are tested in one pass.
+    closest_hit_object = target_registry.pick(aiming_ray_origin, aiming_ray_direction)
 
     # === Step 3: Fire the bullet from the SHIP towards the identified target. ===
 
@@ -1321,10 +2279,10 @@ def fire_weapon():
         final_bullet_vector = [coord / distance_to_target for coord in vector_to_final_target]
 
     # Create the bullet and add it to the game world.
-    bullets.append(Bullet(bullet_start_position, final_bullet_vector))
+    bullets.append(bullet_pool.acquire(bullet_start_position, final_bullet_vector))
 
     # --- Cooldown and Heat Logic  ---
-    weapon_cooldown = max(5, max_weapon_cooldown - (skill_levels['weapon_power'] * 2))
+    weapon_cooldown = timers.schedule(max(5, max_weapon_cooldown - (skill_levels['weapon_power'] * 2)))
     heat_level += heat_per_shot * (1 - skill_levels['heat_management'] * 0.15)
     if heat_level >= heat_max:
         overheated = True
@@ -1332,80 +2290,533 @@ def fire_weapon():
 # =============================
 # Drawing Functions
 # =============================
-# ... (Drawing functions are preserved)
-def draw_bar(x, y, width, height, value, max_value, color, label):
-    # Switch to 2D drawing mode
-    glMatrixMode(GL_PROJECTION) 
+
+# --- Entity Models ---
+# Every model is tessellated once into an OpenGL display list by
+# build_mesh_cache(); the draw() methods only set the transform and color
+# and replay it. Enemy and boss models are built at radius 1 and scaled.
+# Parts whose color never changes carry their own glColor3f.
+# Each model is compiled once per LOD level and takes that level's detail;
+# spheres and cylinders pass it to lod() for their slice and stack counts
+# (cubes have nothing to reduce).
+mesh_cache = {}
+shared_quadric = None
+
+def lod(count, detail, minimum=6):
+    """Slice/stack count at the given detail (never below minimum, nor above count)."""
+    return max(min(count, minimum), int(round(count * detail)))
+
+def model_grunt_body(detail):
     glPushMatrix() 
-    glLoadIdentity() 
-    gluOrtho2D(0,1000,0,800)
-    glMatrixMode(GL_MODELVIEW) 
+    glScalef(1, 0.4, 1) 
+    gluSphere(shared_quadric, 1, lod(16, detail), lod(8, detail, 4)) 
+    glPopMatrix()
+
+def model_grunt_cockpit(detail):
     glPushMatrix() 
-    glLoadIdentity()
+    glTranslatef(0, 0.2, 0) 
+    glColor3f(0.6, 0.6, 0.8) 
+    gluSphere(shared_quadric, 0.4, lod(12, detail), lod(6, detail, 4)) 
+    glPopMatrix()
 
+def model_guardian_block(detail):
+    glPushMatrix() 
+    glScalef(1.2, 1, 1) 
+    glutSolidCube(0.8) 
+    glPopMatrix()
+
+def model_guardian_cannons(detail):
+    # Dark Cannons
+    glColor3f(0.3, 0.3, 0.3) 
+    for side in (1, -1):
+        glPushMatrix() 
+        glTranslatef(side * 0.6, 0, 0) 
+        gluCylinder(shared_quadric, 0.2, 0.2, 0.5, lod(8, detail), 1) 
+        glPopMatrix()
+
+def model_guardian_shield(detail):
+    gluSphere(shared_quadric, 1, lod(16, detail), lod(12, detail, 4))
+
+def model_warper_cube(detail):
+    glutSolidCube(1) 
+
+def model_warper_arms(detail):
+    # Side Rotating parts
+    glColor3f(0.8, 0.8, 0.2)
+    for offset, scale in (((0, 0, 0.5), (0.1, 0.1, 1.5)), ((0, 0, -0.5), (0.1, 0.1, 1.5)),
+                          ((0.5, 0, 0), (1.5, 0.1, 0.1)), ((-0.5, 0, 0), (1.5, 0.1, 0.1))):
+        glPushMatrix() 
+        glTranslatef(*offset) 
+        glScalef(*scale) 
+        glutSolidCube(1) 
+        glPopMatrix()
+
+def model_boss_core(detail):
+    gluSphere(shared_quadric, 0.6, lod(16, detail), lod(12, detail, 4))
+
+def model_boss_ring_flat(detail):
+    glPushMatrix()
+    glScalef(1, 1, 0.2)
+    glutSolidCube(2)
+    glPopMatrix()
+
+def model_boss_ring_tall(detail):
+    glPushMatrix()
+    glScalef(0.2, 1, 1)
+    glutSolidCube(2)
+    glPopMatrix()
+
+def model_charge_particle(detail):
+    gluSphere(shared_quadric, 1, lod(6, detail), lod(6, detail, 4))
+
+def model_laser(detail):
+    # Unit length, tapering to half width at the tip
+    gluCylinder(shared_quadric, 1, 0.5, 1, lod(8, detail), 1)
+
+def model_enemy_bullet(detail):
+    gluSphere(shared_quadric, 1, lod(10, detail), lod(8, detail, 4))
+
+def model_asteroid(detail):
+    gluSphere(shared_quadric, 1, lod(5, detail), lod(5, detail, 4))
+
+def model_player_hull(detail):
+    glPushMatrix()
+    glScalef(3.5, 0.7, 1)
+    gluSphere(shared_quadric, 8, lod(12, detail), lod(8, detail, 4))
+    glPopMatrix()
+
+def model_player_nose(detail):
+    glColor3f(0.3, 0.3, 0.3)
+    glPushMatrix()
+    glTranslatef(20, 0, 0)
+    glScalef(0.5, 0.5, 0.5)
+    glRotatef(90, 0, 1, 0)
+    gluCylinder(shared_quadric, 5, 2, 50, lod(12, detail), 1)
+    glPopMatrix()
+    glColor3f(0.1, 0.3, 0.8)
+    glPushMatrix()
+    glTranslatef(10, 3, 0)
+    glScalef(1, 0.8, 0.8)
+    gluSphere(shared_quadric, 6, lod(10, detail), lod(8, detail, 4))
+    glPopMatrix()
+
+def model_player_wings(detail):
+    for side in (-1, 1):
+        glPushMatrix()
+        glTranslatef(0, 0, side * 15)
+        glScalef(1, 0.2, 2)
+        glutSolidCube(10)
+        glPopMatrix()
+
+def model_player_tail(detail):
+    glColor3f(0.15, 0.6, 0.9)
+    glPushMatrix()
+    glTranslatef(-20, 5, 0)
+    glScalef(0.8, 1.5, 0.2)
+    glutSolidCube(10)
+    glPopMatrix()
+    # Engines
+    glColor3f(0.3, 0.3, 0.3)
+    for side in (-1, 1):
+        glPushMatrix()
+        glTranslatef(-20, 0, side * 8)
+        glRotatef(-90, 0, 1, 0)
+        gluCylinder(shared_quadric, 3, 2, 8, lod(8, detail), 4)
+        glPopMatrix()
+
+def model_player_glow(detail):
+    for side in (-1, 1):
+        glPushMatrix()
+        glTranslatef(-20, 0, side * 8)
+        gluSphere(shared_quadric, 3, lod(8, detail), lod(6, detail, 4))
+        glPopMatrix()
+
+def model_player_shield(detail):
+    glColor3f(0, 0.8, 1) 
+    gluSphere(shared_quadric, 25, lod(16, detail), lod(12, detail, 4))
+
+ENTITY_MODELS = {
+    'grunt_body': model_grunt_body,
+    'grunt_cockpit': model_grunt_cockpit,
+    'guardian_block': model_guardian_block,
+    'guardian_cannons': model_guardian_cannons,
+    'guardian_shield': model_guardian_shield,
+    'warper_cube': model_warper_cube,
+    'warper_arms': model_warper_arms,
+    'boss_core': model_boss_core,
+    'boss_ring_flat': model_boss_ring_flat,
+    'boss_ring_tall': model_boss_ring_tall,
+    'charge_particle': model_charge_particle,
+    'laser': model_laser,
+    'enemy_bullet': model_enemy_bullet,
+    'asteroid': model_asteroid,
+    'player_hull': model_player_hull,
+    'player_nose': model_player_nose,
+    'player_wings': model_player_wings,
+    'player_tail': model_player_tail,
+    'player_glow': model_player_glow,
+    'player_shield': model_player_shield,
+}
+
+def build_mesh_cache(models=None, levels=LOD_LEVELS):
+    """Compiles models (every entity model by default) into one display list per detail level. Needs a GL context, so call it after the window exists."""
+    global shared_quadric
+    if shared_quadric is None:
+        shared_quadric = gluNewQuadric()
+    if models is None:
+        models = ENTITY_MODELS
+    for name, build_model in models.items():
+        if name not in mesh_cache or len(mesh_cache[name]) != len(levels):
+            first = glGenLists(len(levels))
+            mesh_cache[name] = [first + i for i in range(len(levels))]
+        for list_id, detail in zip(mesh_cache[name], levels):
+            glNewList(list_id, GL_COMPILE)
+            build_model(detail)
+            glEndList()
+
+def draw_mesh(name, level=0):
+    glCallList(mesh_cache[name][level])
+
+def select_lod(pos, radius):
+    """LOD level for a model of this radius at pos, from how many pixels its radius covers on screen."""
+    dx, dy, dz = pos[0] - camera_pos[0], pos[1] - camera_pos[1], pos[2] - camera_pos[2]
+    distance = max(1.0, math.sqrt(dx*dx + dy*dy + dz*dz))
+    pixels = radius * 400 / (math.tan(math.radians(fovY / 2)) * distance)
+    level = len(LOD_LEVELS) - 1
+    for i, threshold in enumerate(LOD_PIXEL_THRESHOLDS[:level]):
+        if pixels >= threshold:
+            level = i
+            break
+    if SHOW_LOD_DEBUG:
+        # Call before pushing the entity's transform, so this projects with the camera matrices
+        draw_lod_label(pos, level)
+    return level
+
+def draw_lod_label(pos, level):
+    """Queues an "L<level>" label at pos's screen position (camera matrices must be current)."""
+    x, y, z = gluProject(pos[0], pos[1], pos[2])
+    if 0 <= z <= 1:
+        set_text_color(1, 1, 1)
+        draw_text(x, y, f"L{level}")
+
+def select_lods(centers, radii):
+    """select_lod for an (n, 3) array of centers at once; returns an array of levels."""
+    offset = centers - camera_pos
+    distance = np.maximum(1.0, np.sqrt((offset * offset).sum(axis=1)))
+    pixels = radii * 400 / (math.tan(math.radians(fovY / 2)) * distance)
+    last = len(LOD_LEVELS) - 1
+    levels = np.full(len(centers), last)
+    # Coarsest threshold first, so finer levels overwrite it
+    for i in range(min(last, len(LOD_PIXEL_THRESHOLDS)) - 1, -1, -1):
+        levels[pixels >= LOD_PIXEL_THRESHOLDS[i]] = i
+    if SHOW_LOD_DEBUG:
+        for center, level in zip(centers.tolist(), levels.tolist()):
+            draw_lod_label(center, level)
+    return levels
+
+def sphere_triangles(slices, stacks):
+    """Unit sphere as a flat float32 array of triangle vertices (for vertex buffers)."""
+    theta = np.linspace(0, 2 * math.pi, slices + 1)
+    phi = np.linspace(0, math.pi, stacks + 1)
+    rings = np.stack([
+        np.outer(np.sin(phi), np.cos(theta)),
+        np.outer(np.sin(phi), np.sin(theta)),
+        np.outer(np.cos(phi), np.ones_like(theta)),
+    ], axis=-1)
+    a, b = rings[:-1, :-1], rings[:-1, 1:]
+    c, d = rings[1:, :-1], rings[1:, 1:]
+    triangles = np.stack([a, c, b, b, c, d], axis=2)
+    return np.ascontiguousarray(triangles.reshape(-1, 3), dtype=np.float32)
+
+def laser_triangles(slices):
+    """Side wall of a unit-length cylinder along +z, radius 1 at the base and 0.5 at the tip."""
+    theta = np.linspace(0, 2 * math.pi, slices + 1)
+    base = np.stack([np.cos(theta), np.sin(theta), np.zeros_like(theta)], axis=-1)
+    tip = np.stack([0.5 * np.cos(theta), 0.5 * np.sin(theta), np.ones_like(theta)], axis=-1)
+    a, b = base[:-1], base[1:]
+    c, d = tip[:-1], tip[1:]
+    triangles = np.stack([a, b, c, c, b, d], axis=1)
+    return np.ascontiguousarray(triangles.reshape(-1, 3), dtype=np.float32)
+
+def compile_shader_program(vertex_source, fragment_source, feature):
+    """Links a GLSL program, or prints why feature falls back and returns None."""
+    try:
+        from OpenGL.GL import shaders
+        return shaders.compileProgram(
+            shaders.compileShader(vertex_source, GL_VERTEX_SHADER),
+            shaders.compileShader(fragment_source, GL_FRAGMENT_SHADER))
+    except Exception as e:
+        print(f"{feature} unavailable, using the fallback path: {e}")
+        return None
+
+# --- View Frustum Culling ---
+# setupCamera() rebuilds the six planes of the view volume every frame from
+# the same values it gives gluPerspective and gluLookAt. Entities are tested
+# with a bounding sphere and skipped when it lies fully outside any plane.
+view_frustum = []
+cull_stats = {"drawn": 0, "culled": 0}
+
+def update_view_frustum(eye, target, near, far):
+    """Planes as (nx, ny, nz, d) with unit normals pointing into the view volume."""
+    global view_frustum
+    fx, fy, fz = target[0] - eye[0], target[1] - eye[1], target[2] - eye[2]
+    length = math.sqrt(fx*fx + fy*fy + fz*fz)
+    fx, fy, fz = fx / length, fy / length, fz / length
+    # right = forward x world up, up = right x forward (as gluLookAt builds them)
+    rx, ry, rz = -fz, 0.0, fx
+    length = math.sqrt(rx*rx + rz*rz)
+    rx, rz = rx / length, rz / length
+    ux, uy, uz = ry*fz - rz*fy, rz*fx - rx*fz, rx*fy - ry*fx
+    tan_y = math.tan(math.radians(fovY / 2))
+    tan_x = tan_y * 1.25
+    forward_dot_eye = fx*eye[0] + fy*eye[1] + fz*eye[2]
+    planes = [(fx, fy, fz, -forward_dot_eye - near), (-fx, -fy, -fz, forward_dot_eye + far)]
+    # Side planes pass through the eye: normal = forward * tan(half angle) +/- side axis
+    for sx, sy, sz, tan_half in ((rx, ry, rz, tan_x), (-rx, -ry, -rz, tan_x), (ux, uy, uz, tan_y), (-ux, -uy, -uz, tan_y)):
+        nx, ny, nz = fx * tan_half + sx, fy * tan_half + sy, fz * tan_half + sz
+        length = math.sqrt(nx*nx + ny*ny + nz*nz)
+        nx, ny, nz = nx / length, ny / length, nz / length
+        planes.append((nx, ny, nz, -(nx*eye[0] + ny*eye[1] + nz*eye[2])))
+    view_frustum = planes
+    cull_stats["drawn"] = cull_stats["culled"] = 0
+
+def sphere_in_view(center, radius):
+    if USE_FRUSTUM_CULLING:
+        for nx, ny, nz, d in view_frustum:
+            if nx*center[0] + ny*center[1] + nz*center[2] + d < -radius:
+                cull_stats["culled"] += 1
+                return False
+    cull_stats["drawn"] += 1
+    return True
+
+def spheres_in_view(centers, radii):
+    """sphere_in_view for an (n, 3) array of centers at once; returns a boolean mask."""
+    visible = np.ones(len(centers), dtype=bool)
+    if USE_FRUSTUM_CULLING:
+        for nx, ny, nz, d in view_frustum:
+            visible &= centers @ (nx, ny, nz) + d >= -radii
+    drawn = int(visible.sum())
+    cull_stats["drawn"] += drawn
+    cull_stats["culled"] += len(visible) - drawn
+    return visible
+
+# --- Laser Batching ---
+# Every live laser is expanded on the CPU into one shared vertex array (unit
+# cylinder scaled by the current weapon power, then rotated by the axes cached
+# at spawn and moved to its position) and drawn with a single glDrawArrays.
+laser_mesh = None
+
+def draw_lasers():
+    global laser_mesh
+    laser_length = 80+ (skill_weapon_power * 20)
+    laser_width = 1.5 + (skill_weapon_power * 0.5)
+    # Bounding sphere: centered halfway along the laser
+    bound = laser_length / 2 + laser_width
+    if np is None:
+        for bullet in bullets:
+            if not bullet.alive: continue
+            forward = bullet.axes[2]
+            center = [bullet.pos[i] + forward[i] * laser_length / 2 for i in range(3)]
+            if sphere_in_view(center, bound): bullet.draw()
+        return
+    slots = np.asarray(bullet_store.live_slots(), dtype=int)
+    positions, axes = bullet_store.gather('pos', slots), bullet_store.gather('axes', slots)
+    visible = spheres_in_view(positions + axes[:, 2] * (laser_length / 2), bound)
+    positions, axes = positions[visible], axes[visible]
+    if len(positions) == 0:
+        return
+    if laser_mesh is None:
+        laser_mesh = laser_triangles(8)
+    local = laser_mesh * np.array([laser_width, laser_width, laser_length], dtype=np.float32)
+    # (lasers, vertices, xyz): each local vertex mapped through that laser's right/up/forward rows
+    vertices = np.einsum('vk,nkj->nvj', local, axes) + positions[:, None, :]
+    vertices = np.ascontiguousarray(vertices.reshape(-1, 3), dtype=np.float32)
+    glColor3f(*ENERGY_YELLOW)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, vertices)
+    glDrawArrays(GL_TRIANGLES, 0, len(vertices))
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+# --- Enemy Bullet Batching ---
+# Enemy bullets are drawn straight from enemy_bullet_store: every live slot
+# becomes one instance (position, radius, color) of a shared sphere mesh and
+# the whole lot goes out in a single glDrawArraysInstanced call. On contexts
+# without instancing they are drawn as distance-scaled round point sprites.
+BULLET_INSTANCE_VERTEX_SHADER = """
+#version 120
+attribute vec3 vertex;
+attribute vec4 instance;
+attribute vec3 instance_color;
+varying vec3 color;
+void main() {
+    color = instance_color;
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(instance.xyz + vertex * instance.w, 1.0);
+}
+"""
+BULLET_INSTANCE_FRAGMENT_SHADER = """
+#version 120
+varying vec3 color;
+void main() {
+    gl_FragColor = vec4(color, 1.0);
+}
+"""
+enemy_bullet_renderer = None
+
+def init_enemy_bullet_renderer():
+    """Picks the batched enemy bullet path this context supports ("instanced", "points" or None)."""
+    global enemy_bullet_renderer
+    enemy_bullet_renderer = None
+    if np is None:
+        return
+    # The smallest and largest point size the driver rasterizes
+    enemy_bullet_renderer = {"mode": "points", "point_sizes": tuple(glGetFloatv(GL_ALIASED_POINT_SIZE_RANGE))}
+    if not USE_INSTANCED_BULLETS or not (bool(glDrawArraysInstanced) and bool(glVertexAttribDivisor)):
+        return
+    program = compile_shader_program(BULLET_INSTANCE_VERTEX_SHADER, BULLET_INSTANCE_FRAGMENT_SHADER, "Instanced bullets")
+    if program is None:
+        return
+    # One sphere per LOD level (tessellated like model_enemy_bullet), back to back in one buffer
+    spheres = [sphere_triangles(lod(10, detail), lod(8, detail, 4)) for detail in LOD_LEVELS]
+    sphere_ranges = []
+    first = 0
+    for sphere in spheres:
+        sphere_ranges.append((first, len(sphere)))
+        first += len(sphere)
+    sphere = np.concatenate(spheres)
+    sphere_buffer, instance_buffer = glGenBuffers(2)
+    glBindBuffer(GL_ARRAY_BUFFER, sphere_buffer)
+    glBufferData(GL_ARRAY_BUFFER, sphere.nbytes, sphere, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    enemy_bullet_renderer = {
+        "mode": "instanced",
+        "program": program,
+        "sphere_buffer": sphere_buffer,
+        "sphere_ranges": sphere_ranges,
+        "instance_buffer": instance_buffer,
+        "vertex": glGetAttribLocation(program, "vertex"),
+        "instance": glGetAttribLocation(program, "instance"),
+        "instance_color": glGetAttribLocation(program, "instance_color"),
+    }
+
+def draw_enemy_bullets():
+    if enemy_bullet_renderer is None:
+        for bullet in enemy_bullets:
+            if bullet.alive and sphere_in_view(bullet.pos, bullet.radius): bullet.draw()
+        wall_hazard.draw()
+        return
+    slots = np.asarray(enemy_bullet_store.live_slots(), dtype=int)
+    # One row per bullet: x, y, z, radius, r, g, b
+    instances = np.empty((len(slots), 7), dtype=np.float32)
+    instances[:, 0:3] = enemy_bullet_store.gather('pos', slots)
+    instances[:, 3] = enemy_bullet_store.gather('radius', slots)
+    instances[:, 4:7] = np.clip(enemy_bullet_store.gather('color', slots), 0, 1)
+    instances = instances[spheres_in_view(instances[:, 0:3], instances[:, 3])]
+    # The boss wall's pieces join the same batch
+    if len(wall_hazard):
+        wall = wall_hazard.instances()
+        wall = wall[spheres_in_view(wall[:, 0:3], wall[:, 3])]
+        instances = np.concatenate((instances, wall))
+    if len(instances) == 0:
+        return
+    if enemy_bullet_renderer["mode"] == "instanced":
+        draw_instanced_spheres(instances)
+    else:
+        draw_point_sprites(instances)
+
+def draw_instanced_spheres(instances):
+    r = enemy_bullet_renderer
+    # Sorted by LOD level, so each level is one contiguous run of instances
+    levels = select_lods(instances[:, 0:3], instances[:, 3])
+    instances = np.ascontiguousarray(instances[np.argsort(levels, kind='stable')])
+    level_counts = np.bincount(levels, minlength=len(LOD_LEVELS)).tolist()
+    glUseProgram(r["program"])
+    glBindBuffer(GL_ARRAY_BUFFER, r["sphere_buffer"])
+    glEnableVertexAttribArray(r["vertex"])
+    glVertexAttribPointer(r["vertex"], 3, GL_FLOAT, GL_FALSE, 0, None)
+
+    glBindBuffer(GL_ARRAY_BUFFER, r["instance_buffer"])
+    glBufferData(GL_ARRAY_BUFFER, instances.nbytes, instances, GL_STREAM_DRAW)
+    stride = instances.strides[0]
+    glEnableVertexAttribArray(r["instance"])
+    glVertexAttribDivisor(r["instance"], 1)
+    glEnableVertexAttribArray(r["instance_color"])
+    glVertexAttribDivisor(r["instance_color"], 1)
+
+    start = 0
+    for (first, vertex_count), count in zip(r["sphere_ranges"], level_counts):
+        if count == 0:
+            continue
+        # Point the per-instance attributes at this level's run
+        glVertexAttribPointer(r["instance"], 4, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(start * stride))
+        glVertexAttribPointer(r["instance_color"], 3, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(start * stride + 16))
+        glDrawArraysInstanced(GL_TRIANGLES, first, vertex_count, count)
+        start += count
+
+    glVertexAttribDivisor(r["instance"], 0)
+    glVertexAttribDivisor(r["instance_color"], 0)
+    for location in (r["vertex"], r["instance"], r["instance_color"]):
+        glDisableVertexAttribArray(location)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glUseProgram(0)
+
+def draw_point_sprites(instances):
+    # Fixed-function fallback: size falls off with 1/distance, like a real sphere
+    pixels_per_unit = 800 / math.tan(math.radians(fovY / 2))
+    smallest, largest = enemy_bullet_renderer["point_sizes"]
+    # Round each radius to a power of POINT_SPRITE_SIZE_STEP; sorted, so each size is one contiguous run
+    steps = np.round(np.log(instances[:, 3]) / math.log(POINT_SPRITE_SIZE_STEP)).astype(int)
+    order = np.argsort(steps, kind='stable')
+    steps, instances = steps[order], instances[order]
+    firsts, counts = np.unique(steps, return_index=True, return_counts=True)[1:]
+    # Each run is drawn at its mean radius, so runs of one radius (bullet types, the wall) stay exact
+    sizes = np.add.reduceat(instances[:, 3].astype(float), firsts) / counts * pixels_per_unit
+    # glPointSize must stay within the driver's range, so the sizes are scaled
+    # down to fit and the attenuation divides by the same factor
+    scale = min(1.0, largest / sizes.max())
+    positions = np.ascontiguousarray(instances[:, 0:3])
+    colors = np.ascontiguousarray(instances[:, 4:7])
+    glEnable(GL_POINT_SMOOTH)
+    glPointParameterfv(GL_POINT_DISTANCE_ATTENUATION, (0, 0, scale * scale))
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(3, GL_FLOAT, 0, positions)
+    glColorPointer(3, GL_FLOAT, 0, colors)
+    for size, first, count in zip(sizes.tolist(), firsts.tolist(), counts.tolist()):
+        glPointSize(min(max(size * scale, smallest), largest))
+        glDrawArrays(GL_POINTS, first, count)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glPointParameterfv(GL_POINT_DISTANCE_ATTENUATION, (1, 0, 0))
+    glDisable(GL_POINT_SMOOTH)
+
+# ... (Drawing functions are preserved)
+def draw_bar(x, y, width, height, value, max_value, color, label):
     # Calculate fill width
     if max_value > 0:
         fill_width = (value / max_value) * width 
     else:
         fill_width = 0
     
-    # Draw the colored fill bar using glVertex3f
-    glBegin(GL_QUADS)
-    glColor3f(*color)
-    glVertex3f(x, y, 0) 
-    glVertex3f(x + fill_width, y, 0)
-    glVertex3f(x + fill_width, y + height, 0) 
-    glVertex3f(x, y + height, 0)
-    glEnd()
-    
-    # Draw the white border using glVertex3f
-    glColor3f(1, 1, 1) # Set color to white for border and text
-    glBegin(GL_LINE_LOOP)
-    glVertex3f(x, y, 0) 
-    glVertex3f(x + width, y, 0)
-    glVertex3f(x + width, y + height, 0)
-    glVertex3f(x, y + height, 0)
-    glEnd()
-    
-    # Draw the text label
+    # Colored fill, white border and label, all drawn by the overlay pass
+    overlay_rect(x, y, fill_width, height, color)
+    overlay_outline(x, y, width, height, (1, 1, 1))
+    set_text_color(1, 1, 1) # Set color to white for the text
     draw_text(x + 5, y - 20, label)
-
-    # Restore 3D drawing mode
-    glPopMatrix() 
-    glMatrixMode(GL_PROJECTION) 
-    glPopMatrix() 
-    glMatrixMode(GL_MODELVIEW)
 def draw_button(x, y, w, h, text):
-    glColor3f(0.1, 0.2, 0.4) 
-    glBegin(GL_QUADS)
-    glVertex3f(x, y, 0) 
-    glVertex3f(x + w, y, 0) 
-    glVertex3f(x + w, y + h, 0) 
-    glVertex3f(x, y + h, 0) 
-    glEnd()
-    glColor3f(*NEON_CYAN) 
-    glBegin(GL_LINES) 
-    glVertex3f(x, y, 0) 
-    glVertex3f(x+w, y, 0) 
-    glVertex3f(x+w, y, 0) 
-    glVertex3f(x+w, y+h, 0) 
-    glVertex3f(x+w, y+h, 0) 
-    glVertex3f(x, y+h, 0) 
-    glVertex3f(x, y+h, 0) 
-    glVertex3f(x, y, 0) 
-    glEnd()
-    glColor3f(1, 1, 1) 
+    overlay_rect(x, y, w, h, (0.1, 0.2, 0.4))
+    overlay_outline(x, y, w, h, NEON_CYAN)
+    set_text_color(1, 1, 1) 
     draw_text(x + 20, y + 15, text)
 def draw_start_menu():
     # --- Title and Buttons (Existing) ---
-    glColor3f(1,1,1)
+    set_text_color(1,1,1)
     draw_text(250, 600, "ALIEN INVASION SURVIVAL")
     draw_button(350, 400, 300, 50, "START GAME")
     draw_button(350, 300, 300, 50, "HIGH SCORES")
     draw_button(350, 200, 300, 50, "EXIT")
 
     # --- UPDATED: Controls Display Section ---
-    glColor3f(0.8, 0.8, 0.8) 
+    set_text_color(0.8, 0.8, 0.8) 
     
     # --- Movement & Aiming ---
     draw_text(50, 200, "SHIP MOVEMENT")
@@ -1426,7 +2837,7 @@ def draw_start_menu():
     draw_text(750, 50, "CYCLE SPECIAL: [T]")
     draw_text(400, 25, "TOGGLE CAMERA VIEW: [M]")
 def draw_high_score_screen():
-    glColor3f(*NEON_CYAN) 
+    set_text_color(*NEON_CYAN) 
     draw_text(380, 650, "--- HIGH SCORES ---")
     y_pos = 600
     if not high_scores: draw_text(400, y_pos, "No scores yet!")
@@ -1435,20 +2846,25 @@ def draw_high_score_screen():
             color = ENERGY_YELLOW  
         else: 
             color = (0.9, 0.9, 0.9)
-        glColor3f(*color) 
+        set_text_color(*color) 
         score_text = f"{i+1}. {name:<10} {score:>6} L{level}"
         draw_text(350, y_pos, score_text)
         y_pos -= 40
     draw_button(350, 100, 300, 50, "BACK TO MENU")
 def draw_pause_screen():
-    glColor3f(*ENERGY_YELLOW)
+    set_text_color(*ENERGY_YELLOW)
     draw_text(450, 500, "PAUSED")
     draw_button(350, 400, 300, 50, "RESUME")
     draw_button(350, 300, 300, 50, "EXIT TO MENU")
 def draw_crosshair():
-    size = 15
     glPushMatrix()
     glTranslatef(crosshair_pos[0], crosshair_pos[1], crosshair_pos[2])
+    draw_world_mesh('crosshair')
+    glPopMatrix()
+def draw_background():
+    draw_world_mesh('background')
+def model_crosshair(detail):
+    size = 15
     glColor3f(*NEON_GREEN)
     glBegin(GL_LINES)
     glVertex3f(0, -size, 0)
@@ -1456,8 +2872,8 @@ def draw_crosshair():
     glVertex3f(-size, 0, 0)
     glVertex3f(size, 0, 0)
     glEnd()
-    glPopMatrix()
-def draw_background():
+def model_background(detail):
+    # Matrix calls are recorded too, so the whole full-screen pass is one glCallList
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
     glLoadIdentity()
@@ -1476,7 +2892,208 @@ def draw_background():
     glMatrixMode(GL_PROJECTION)
     glPopMatrix()
     glMatrixMode(GL_MODELVIEW)
+# --- Batched Text ---
+# The font is rasterized once (with glutBitmapCharacter into an offscreen
+# framebuffer, read back through glReadPixels) into a texture atlas.
+# draw_text() then only queues the string with the color last given to
+# set_text_color(), and the overlay pass draws every queued string of the
+# frame as textured quads in one call. Each distinct string is laid out once
+# and reused until the cache fills up.
+TEXT_CELL_HEIGHT = 28
+TEXT_BASELINE = 7
+TEXT_GLYPH_PAD = 2
+text_atlas = None
+text_layouts = {}
+text_queue = []
+text_color = (1.0, 1.0, 1.0, 1.0)
+
+def build_text_atlas(font=GLUT_BITMAP_HELVETICA_18):
+    """
+    Renders printable ASCII into an alpha texture. Needs a GL context;
+    without NumPy or framebuffer objects draw_text stays immediate.
+    """
+    global text_atlas
+    text_atlas = None
+    text_layouts.clear()
+    if np is None or not bool(glGenFramebuffers):
+        return
+    glyphs = {}
+    x, y = 0, 0
+    for code in range(32, 127):
+        advance = glutBitmapWidth(font, code)
+        cell_width = advance + 2 * TEXT_GLYPH_PAD
+        if x + cell_width > 1000:
+            x, y = 0, y + TEXT_CELL_HEIGHT
+        glyphs[chr(code)] = (x, y, cell_width, advance)
+        x += cell_width
+    width, height = 1000, y + TEXT_CELL_HEIGHT
+
+    # Draw every glyph in white on black into an offscreen framebuffer and
+    # read it back. The window's own pixels can't be used: before it is shown
+    # (or wherever it is covered) reading them back is undefined.
+    framebuffer = glGenFramebuffers(1)
+    renderbuffer = glGenRenderbuffers(1)
+    glBindRenderbuffer(GL_RENDERBUFFER, renderbuffer)
+    glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+    glBindRenderbuffer(GL_RENDERBUFFER, 0)
+    glBindFramebuffer(GL_FRAMEBUFFER, framebuffer)
+    glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, renderbuffer)
+    coverage = None
+    if glCheckFramebufferStatus(GL_FRAMEBUFFER) == GL_FRAMEBUFFER_COMPLETE:
+        viewport = glGetIntegerv(GL_VIEWPORT)
+        glViewport(0, 0, width, height)
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        gluOrtho2D(0, width, 0, height)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+        glDisable(GL_DEPTH_TEST)
+        glClear(GL_COLOR_BUFFER_BIT)
+        glColor3f(1, 1, 1)
+        for ch, (gx, gy, cell_width, advance) in glyphs.items():
+            glRasterPos2f(gx + TEXT_GLYPH_PAD, gy + TEXT_BASELINE)
+            glutBitmapCharacter(font, ord(ch))
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        pixels = glReadPixels(0, 0, width, height, GL_RED, GL_UNSIGNED_BYTE)
+        coverage = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width)
+        glEnable(GL_DEPTH_TEST)
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glViewport(*viewport)
+    glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    glDeleteFramebuffers(1, [framebuffer])
+    glDeleteRenderbuffers(1, [renderbuffer])
+    if coverage is None:
+        return
+
+    texture = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture)
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, width, height, 0, GL_ALPHA, GL_UNSIGNED_BYTE, np.where(coverage > 127, 255, 0).astype(np.uint8))
+    glBindTexture(GL_TEXTURE_2D, 0)
+    text_atlas = {"texture": texture, "width": width, "height": height, "glyphs": glyphs}
+
+def layout_text(text):
+    """Quad corners (x, y, s, t) for text, relative to its start on the baseline."""
+    layout = text_layouts.get(text)
+    if layout is not None:
+        return layout
+    if len(text_layouts) >= TEXT_LAYOUT_CACHE_SIZE:
+        text_layouts.clear()
+    corners = []
+    pen = 0
+    width, height = text_atlas["width"], text_atlas["height"]
+    for ch in text:
+        glyph = text_atlas["glyphs"].get(ch)
+        if glyph is None:
+            continue
+        gx, gy, cell_width, advance = glyph
+        if ch != ' ':
+            x0, x1 = pen - TEXT_GLYPH_PAD, pen - TEXT_GLYPH_PAD + cell_width
+            y0, y1 = -TEXT_BASELINE, TEXT_CELL_HEIGHT - TEXT_BASELINE
+            s0, s1 = gx / width, (gx + cell_width) / width
+            t0, t1 = gy / height, (gy + TEXT_CELL_HEIGHT) / height
+            corners += [(x0, y0, s0, t0), (x1, y0, s1, t0), (x1, y1, s1, t1), (x0, y1, s0, t1)]
+        pen += advance
+    layout = np.array(corners, dtype=np.float32).reshape(-1, 4)
+    text_layouts[text] = layout
+    return layout
+
+def draw_queued_text():
+    """Draws the strings queued by draw_text this frame. Expects the overlay's 2D projection."""
+    if text_atlas is None:
+        batched = []
+    else:
+        batched = [(x, y, color, layout_text(text)) for x, y, color, text, font in text_queue if font == GLUT_BITMAP_HELVETICA_18]
+    # Bitmap fallback (no atlas, or another font)
+    for x, y, color, text, font in text_queue:
+        if text_atlas is None or font != GLUT_BITMAP_HELVETICA_18:
+            glColor4f(*color)
+            glRasterPos2f(x, y)
+            for ch in text: glutBitmapCharacter(font, ord(ch))
+    text_queue.clear()
+    if not batched:
+        return
+    vertices = np.concatenate([layout[:, 0:2] + (x, y) for x, y, color, layout in batched])
+    texcoords = np.concatenate([layout[:, 2:4] for x, y, color, layout in batched])
+    colors = np.concatenate([np.repeat([color], len(layout), axis=0) for x, y, color, layout in batched])
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+    texcoords = np.ascontiguousarray(texcoords, dtype=np.float32)
+    colors = np.ascontiguousarray(colors, dtype=np.float32)
+
+    glEnable(GL_TEXTURE_2D)
+    glBindTexture(GL_TEXTURE_2D, text_atlas["texture"])
+    glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+    glEnable(GL_ALPHA_TEST)
+    glAlphaFunc(GL_GREATER, 0.5)
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+    glEnableClientState(GL_COLOR_ARRAY)
+    glVertexPointer(2, GL_FLOAT, 0, vertices)
+    glTexCoordPointer(2, GL_FLOAT, 0, texcoords)
+    glColorPointer(4, GL_FLOAT, 0, colors)
+    glDrawArrays(GL_QUADS, 0, len(vertices))
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+    glDisable(GL_ALPHA_TEST)
+    glBindTexture(GL_TEXTURE_2D, 0)
+    glDisable(GL_TEXTURE_2D)
+
+def set_text_color(r, g, b):
+    """Color for the draw_text() calls that follow. Kept here rather than read back from GL on every string."""
+    global text_color
+    text_color = (r, g, b, 1.0)
+
 def draw_text(x, y, text, font=GLUT_BITMAP_HELVETICA_18):
+    text_queue.append((x, y, text_color, text, font))
+
+# --- 2D Overlay ---
+# Bars, buttons, panels and the damage border are queued as screen-space
+# rectangles and outlines (0..1000 x 0..800, like the mouse handler uses).
+# flush_overlay() draws the whole overlay at the end of the frame under one
+# ortho projection: all rectangles, then all outlines, then all text.
+overlay_quads = []
+overlay_lines = []
+
+def overlay_rect(x, y, w, h, color):
+    overlay_quads.extend([(x, y, *color), (x + w, y, *color), (x + w, y + h, *color), (x, y + h, *color)])
+
+def overlay_outline(x, y, w, h, color):
+    corners = [(x, y, *color), (x + w, y, *color), (x + w, y + h, *color), (x, y + h, *color)]
+    for i in range(4):
+        overlay_lines.extend([corners[i], corners[(i + 1) % 4]])
+
+def draw_overlay_shapes(mode, shapes):
+    if not shapes:
+        return
+    if np is None:
+        glBegin(mode)
+        for x, y, r, g, b in shapes:
+            glColor3f(r, g, b)
+            glVertex2f(x, y)
+        glEnd()
+    else:
+        data = np.array(shapes, dtype=np.float32)
+        vertices = np.ascontiguousarray(data[:, 0:2])
+        colors = np.ascontiguousarray(data[:, 2:5])
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, vertices)
+        glColorPointer(3, GL_FLOAT, 0, colors)
+        glDrawArrays(mode, 0, len(vertices))
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+    shapes.clear()
+
+def flush_overlay():
+    """Draws everything queued for the 2D overlay this frame, on top of the scene."""
     glMatrixMode(GL_PROJECTION)
     glPushMatrix()
     glLoadIdentity()
@@ -1484,26 +3101,98 @@ def draw_text(x, y, text, font=GLUT_BITMAP_HELVETICA_18):
     glMatrixMode(GL_MODELVIEW)
     glPushMatrix()
     glLoadIdentity()
-    glRasterPos2f(x, y)
-    for ch in text: glutBitmapCharacter(font, ord(ch))
+    glDisable(GL_DEPTH_TEST)
+    draw_overlay_shapes(GL_QUADS, overlay_quads)
+    draw_overlay_shapes(GL_LINES, overlay_lines)
+    draw_queued_text()
+    glEnable(GL_DEPTH_TEST)
     glPopMatrix()
     glMatrixMode(GL_PROJECTION)
     glPopMatrix()
     glMatrixMode(GL_MODELVIEW)
 def init_stars():
     global star_positions
-    for _ in range(400): star_positions.append([random.uniform(-ARENA_WIDTH * 2, ARENA_WIDTH * 2), random.uniform(-ARENA_HEIGHT * 2, ARENA_HEIGHT * 2), random.uniform(0, ARENA_DEPTH)])
+    for _ in range(STAR_COUNT): star_positions.append([random.uniform(-ARENA_WIDTH * 2, ARENA_WIDTH * 2), random.uniform(-ARENA_HEIGHT * 2, ARENA_HEIGHT * 2), random.uniform(0, ARENA_DEPTH)])
+
+# --- GPU Starfield ---
+# The stars' starting positions sit in a static vertex buffer. Each frame only
+# the scroll distance is sent; the vertex shader moves every star towards the
+# camera, wraps it back to the far end and applies the depth fade, exactly
+# like the old per-star loop (4 units per frame, z kept in (-10, ARENA_DEPTH]).
+STAR_VERTEX_SHADER = """
+#version 120
+attribute vec3 star;
+uniform float time;
+uniform float depth;
+void main() {
+    float z = depth - mod(depth - star.z + time * 4.0, depth + 10.0);
+    float alpha = 0.2 + 0.3 * (z / depth);
+    gl_FrontColor = vec4(alpha * 0.8, alpha * 0.8, alpha, 1.0);
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(star.xy, z, 1.0);
+}
+"""
+STAR_FRAGMENT_SHADER = """
+#version 120
+void main() {
+    gl_FragColor = gl_Color;
+}
+"""
+star_renderer = None
+star_time = 0
+
+def init_star_renderer():
+    """Uploads star_positions once. Leaves star_renderer None (CPU loop) without NumPy or shaders."""
+    global star_renderer
+    star_renderer = None
+    if np is None or not star_positions:
+        return
+    program = compile_shader_program(STAR_VERTEX_SHADER, STAR_FRAGMENT_SHADER, "GPU starfield")
+    if program is None:
+        return
+    stars = np.array(star_positions, dtype=np.float32)
+    star_buffer = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, star_buffer)
+    glBufferData(GL_ARRAY_BUFFER, stars.nbytes, stars, GL_STATIC_DRAW)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    star_renderer = {
+        "program": program,
+        "buffer": star_buffer,
+        "count": len(stars),
+        "star": glGetAttribLocation(program, "star"),
+        "time": glGetUniformLocation(program, "time"),
+        "depth": glGetUniformLocation(program, "depth"),
+    }
+
 def draw_stars():
+    global star_time
+    if star_renderer is not None:
+        # Time is counted in simulation ticks, wrapped once per full pass to keep float precision
+        star_time = (star_time + render_tick_delta) % ((ARENA_DEPTH + 10) / 4)
+        r = star_renderer
+        glPointSize(1.5)
+        glUseProgram(r["program"])
+        glUniform1f(r["time"], star_time)
+        glUniform1f(r["depth"], ARENA_DEPTH)
+        glBindBuffer(GL_ARRAY_BUFFER, r["buffer"])
+        glEnableVertexAttribArray(r["star"])
+        glVertexAttribPointer(r["star"], 3, GL_FLOAT, GL_FALSE, 0, None)
+        glDrawArrays(GL_POINTS, 0, r["count"])
+        glDisableVertexAttribArray(r["star"])
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+        return
     glPointSize(1.5)
     glBegin(GL_POINTS)
     for star in star_positions:
-        star[2] -= 4
+        star[2] -= 4 * render_tick_delta
         if star[2] < -10: star[2] = ARENA_DEPTH
         alpha = 0.2 + 0.3 * (star[2] / ARENA_DEPTH)
         glColor3f(alpha * 0.8, alpha * 0.8, alpha)
         glVertex3f(star[0], star[1], star[2])
     glEnd()
 def draw_corridor():
+    draw_world_mesh('corridor')
+def model_corridor(detail):
     glColor3f(0.3, 0.6, 1)
     glBegin(GL_LINES)
     for z in range(0, int(ARENA_DEPTH), 200):
@@ -1521,7 +3210,29 @@ def draw_corridor():
     glVertex3f(ARENA_WIDTH, ARENA_HEIGHT, ARENA_DEPTH)
     glEnd()
 
+# --- Static World Geometry ---
+# The corridor, background and crosshair shape never change from frame to
+# frame, so they live in the mesh cache as display lists like the entity
+# models. They are built from the ARENA_* dimensions, so they are compiled
+# on first use and again whenever those dimensions change.
+WORLD_MODELS = {
+    'corridor': model_corridor,
+    'background': model_background,
+    'crosshair': model_crosshair,
+}
+world_mesh_dimensions = None
+
+def draw_world_mesh(name):
+    global world_mesh_dimensions
+    dimensions = (ARENA_WIDTH, ARENA_HEIGHT, ARENA_DEPTH)
+    if dimensions != world_mesh_dimensions:
+        build_mesh_cache(WORLD_MODELS, (1.0,))
+        world_mesh_dimensions = dimensions
+    draw_mesh(name)
+
 def draw_3d_player():
+    # The ship (and its shield bubble) fits in a radius of about 25
+    level = select_lod(player_pos, 25)
     glPushMatrix()
     glTranslatef(player_pos[0], player_pos[1], player_pos[2])
     glRotatef(-90,0,1,0)
@@ -1549,69 +3260,24 @@ def draw_3d_player():
     glColor3f(*base_color) 
     hull_scale = 1+ (skill_health_boost * 0.05)
     glPushMatrix()
-    glScalef(3.5 * hull_scale, 0.7 * hull_scale, 1* hull_scale)
-    gluSphere(gluNewQuadric(), 8, 12, 8)
-    glPopMatrix()
-    glColor3f(0.3, 0.3, 0.3)
-    glPushMatrix()
-    glTranslatef(20, 0, 0)
-    glScalef(0.5, 0.5, 0.5)
-    glRotatef(90, 0, 1, 0)
-    gluCylinder(gluNewQuadric(), 5, 2, 50, 12, 1)
-    glPopMatrix()
-    glColor3f(0.1, 0.3, 0.8)
-    glPushMatrix()
-    glTranslatef(10, 3, 0)
-    glScalef(1, 0.8, 0.8)
-    gluSphere(gluNewQuadric(), 6, 10, 8)
+    glScalef(hull_scale, hull_scale, hull_scale)
+    draw_mesh('player_hull', level)
     glPopMatrix()
+    draw_mesh('player_nose', level)
     wing_color = [0.15, 0.6, 0.9]
     if skill_faster_evasion >= 2: 
         wing_color[1] = min(1, wing_color[1] + 0.3)
     glColor3f(*wing_color)
-    glPushMatrix()
-    glTranslatef(0, 0, -15)
-    glScalef(1, 0.2, 2)
-    glutSolidCube(10)
-    glPopMatrix()
-    glPushMatrix()
-    glTranslatef(0, 0, 15)
-    glScalef(1, 0.2, 2)
-    glutSolidCube(10)
-    glPopMatrix()
-    glColor3f(0.15, 0.6, 0.9)
-    glPushMatrix()
-    glTranslatef(-20, 5, 0)
-    glScalef(0.8, 1.5, 0.2)
-    glutSolidCube(10)
-    glPopMatrix()
-    glColor3f(0.3, 0.3, 0.3)
-    glPushMatrix()
-    glTranslatef(-20, 0, -8)
-    glRotatef(-90, 0, 1, 0)
-    gluCylinder(gluNewQuadric(), 3, 2, 8, 8, 4)
-    glPopMatrix()
-    glPushMatrix() 
-    glTranslatef(-20, 0, 8)
-    glRotatef(-90, 0, 1, 0)
-    gluCylinder(gluNewQuadric(), 3, 2, 8, 8, 4)
-    glPopMatrix()
+    draw_mesh('player_wings', level)
+    draw_mesh('player_tail', level)
     if is_sprinting or mobility_boost_active:
         glow_color = NEON_PINK  
     else:
         glow_color = (0.3, 0.3, 0.3)
     glColor3f(*glow_color)
-    glPushMatrix()
-    glTranslatef(-20, 0, -8)
-    gluSphere(gluNewQuadric(), 3, 8, 6)
-    glPopMatrix()
-    glPushMatrix()
-    glTranslatef(-20, 0, 8)
-    gluSphere(gluNewQuadric(), 3, 8, 6)
-    glPopMatrix()
+    draw_mesh('player_glow', level)
     if special_ability_active and current_special == "SHIELD_BUBBLE": 
-        glColor3f(0, 0.8, 1) 
-        gluSphere(gluNewQuadric(), 25, 16, 12)
+        draw_mesh('player_shield', level)
     glPopMatrix()
 def draw_boss_health_bar():
     if not boss or not boss.alive: return
@@ -1623,7 +3289,7 @@ def draw_boss_health_bar():
     health_color = NEON_GREEN
     if health_ratio < 0.6: health_color = ENERGY_YELLOW
     if health_ratio < 0.3: health_color = WARNING_RED
-    glColor3f(*health_color)
+    set_text_color(*health_color)
     draw_text(350, 700, f"HIVE OVERLORD: {health_percentage}%")
 def draw_enhanced_hud():
     # --- Health, Stamina, and Heat Bars  ---
@@ -1650,11 +3316,11 @@ def draw_enhanced_hud():
     draw_bar(15, 650, 160, 20, heat_level, heat_max, heat_color, f"HEAT: {int(heat_level)}")
     if overheated:
         pulse = 0.5 + 0.5 * math.sin(game_time * 0.2)
-        glColor3f(1, pulse * 0.2, 0)
+        set_text_color(1, pulse * 0.2, 0)
         draw_text(180, 675, "OVERHEATED!")
 
     # --- Score  ---
-    glColor3f(*ENERGY_YELLOW)
+    set_text_color(*ENERGY_YELLOW)
     draw_text(400, 750, f"SCORE: {current_score}")
 
     # --- Special Ability Bar (Bottom-Right) ---
@@ -1663,25 +3329,25 @@ def draw_enhanced_hud():
     if special_ability_meter >= special_ability_max:
         bar_label = "SPECIAL READY!"
     draw_bar(720, 60, 200, 20, special_ability_meter, special_ability_max, special_color, bar_label)
-    glColor3f(0.8,0.8,0.8)
+    set_text_color(0.8,0.8,0.8)
     draw_text(710, 10, f"'{current_special.replace('_', ' ')}' selected (T)")
 
     # --- Active Ability Text ) ---
     if special_ability_active:
         pulse = 0.7 + 0.3 * math.sin(game_time * 0.2)
-        glColor3f(pulse, 0.2, pulse)
-        secs_left = int(special_ability_timer / 60) + 1
+        set_text_color(pulse, 0.2, pulse)
+        secs_left = int(ticks_left(special_ability_timer) / 60) + 1
         draw_text(320, 100, f"{current_special.replace('_', ' ')} ACTIVE: {secs_left}s")
 
     # --- Bottom-Left UI Text ---
-    glColor3f(0.7, 0.7, 0.7)
+    set_text_color(0.7, 0.7, 0.7)
     draw_text(350, 30, "LVL " + str(player_level))
     if experience_to_next_level > 0:
         exp_ratio = experience_points / experience_to_next_level  
     else:
         exp_ratio = 0
     draw_text(350, 10, f"EXP: [{'#' * int(exp_ratio * 20):<20}]")
-    glColor3f(1,1,1)
+    set_text_color(1,1,1)
     draw_text(10, 10, f"CAM: {camera_mode}") #<-- MOVED to bottom-left
 
     # --- Top-Right Buttons  ---
@@ -1692,13 +3358,13 @@ def draw_enhanced_hud():
     y_offset = 80  # Starting vertical position for the timers
 
     # Set the text color to a bright yellow
-    glColor3f(ENERGY_YELLOW[0], ENERGY_YELLOW[1], ENERGY_YELLOW[2])
+    set_text_color(ENERGY_YELLOW[0], ENERGY_YELLOW[1], ENERGY_YELLOW[2])
 
     # Loop through all the temporary skills
     for skill, data in temp_skills.items():
         if data["active"]:
             # Calculate remaining seconds and format the string
-            seconds_left = data["timer"] / 60.0
+            seconds_left = ticks_left(data["timer"]) / 60.0
             timer_text = f"{data['name']}: {seconds_left:.1f}s"
 
             # Draw the text on the right side of the screen
@@ -1710,23 +3376,23 @@ def draw_enhanced_hud():
 def draw_game_over_screen():
     global high_scores
     if name_input_mode:
-        glColor3f(*ENERGY_YELLOW)
+        set_text_color(*ENERGY_YELLOW)
         draw_text(350, 500, "NEW HIGH SCORE!")
         draw_text(320, 460, "Enter Your Name (10 chars max):")
         if len(player_name) < 10:
             display_name = player_name + "_" 
         else:
             display_name = player_name
-        glColor3f(*NEON_GREEN)
+        set_text_color(*NEON_GREEN)
         draw_text(400, 420, display_name)
-        glColor3f(0.8, 0.8, 0.8)
+        set_text_color(0.8, 0.8, 0.8)
         draw_text(350, 380, "Press ENTER to save.")
     else:
-        glColor3f(*WARNING_RED)
+        set_text_color(*WARNING_RED)
         draw_text(400, 650, "GAME OVER")
-        glColor3f(1,1,1)
+        set_text_color(1,1,1)
         draw_text(380, 620, f"FINAL SCORE: {current_score}")
-        glColor3f(*NEON_CYAN)
+        set_text_color(*NEON_CYAN)
         draw_text(380, 550, "--- HIGH SCORES ---")
         y_pos = 500
         if not high_scores: draw_text(400, y_pos, "No scores yet!")
@@ -1735,25 +3401,19 @@ def draw_game_over_screen():
                 color = ENERGY_YELLOW  
             else:
                 color = (0.9, 0.9, 0.9)
-            glColor3f(*color)
+            set_text_color(*color)
             score_text = f"{i+1}. {name:<10} {score:>6} L{level}"
             draw_text(350, y_pos, score_text)
             y_pos -= 40
-        glColor3f(1,1,1)
+        set_text_color(1,1,1)
         draw_text(410, 250, "Press R to Restart")
 def draw_skill_menu():
     """Draw the skill menu with temporary and permanent skills."""
-    glColor3f(0.1, 0.1, 0.2)
-    glBegin(GL_QUADS)
-    glVertex3f(200, 150, 0)
-    glVertex3f(800, 150, 0)
-    glVertex3f(800, 650, 0)
-    glVertex3f(200, 650, 0)
-    glEnd()
+    overlay_rect(200, 150, 600, 500, (0.1, 0.1, 0.2))
 
-    glColor3f(*NEON_CYAN)
+    set_text_color(*NEON_CYAN)
     draw_text(380, 600, "--- SKILL UPGRADES ---")
-    glColor3f(*ENERGY_YELLOW)
+    set_text_color(*ENERGY_YELLOW)
     draw_text(220, 560, f"Skill Points: {skill_points}")
 
     y_pos = 500
@@ -1770,7 +3430,7 @@ def draw_skill_menu():
             color = (0.7, 0.7, 0.7)
             status = "(Locked)"
 
-        glColor3f(*color)
+        set_text_color(*color)
         if name == "mobility_boost":
             label = "1 Mobility Boost (2 mins)"  
         else:
@@ -1793,12 +3453,12 @@ def draw_skill_menu():
             cost = costs[level]
             status = f"[{level}/{len(costs)}] (Need {cost})"
 
-        glColor3f(*color)
+        set_text_color(*color)
         draw_text(220, y_pos, f"{num} {name.replace('_', ' ').title()} {status}")
         y_pos -= 40
         num+=1
 
-    glColor3f(1, 1, 1)
+    set_text_color(1, 1, 1)
     draw_text(350, 200, "Press 'V' to close menu")
 
 # =============================
@@ -1823,7 +3483,7 @@ def specialKeyListener(key, x, y):
         crosshair_move_x_dir = -1
 def keyboardListener(key, x, y):
     # CAMERA controls with IJKL and other controls
-    global player_name, name_input_mode, is_sprinting, fatigued, game_state, camera_mode, player_move_y_timer, player_move_y_dir, player_move_x_timer, player_move_x_dir, fire_timer, skill_points, mobility_boost_active, mobility_boost_timer, weapon_mastery_active, weapon_mastery_timer, is_evading, evade_timer, evade_direction, camera_angle, camera_height
+    global player_name, name_input_mode, is_sprinting, fatigued, game_state, camera_mode, player_move_y_timer, player_move_y_dir, player_move_x_timer, player_move_x_dir, fire_timer, skill_points, mobility_boost_active, mobility_boost_timer, weapon_mastery_active, weapon_mastery_timer, is_evading, evade_timer, evade_cooldown, evade_direction, camera_angle, camera_height
     
     if game_state == "GAME_OVER" and name_input_mode:
         if key == b'\r':
@@ -1843,11 +3503,11 @@ def keyboardListener(key, x, y):
         if key == b'1' and skill_points >= 1 and not mobility_boost_active:
             skill_points -= 1
             mobility_boost_active = True
-            mobility_boost_timer = MOBILITY_BOOST_DURATION
+            mobility_boost_timer = timers.schedule(MOBILITY_BOOST_DURATION, end_mobility_boost)
         elif key == b'2' and skill_points >= 1 and not weapon_mastery_active:
             skill_points -= 1
             weapon_mastery_active = True
-            weapon_mastery_timer = WEAPON_MASTERY_DURATION
+            weapon_mastery_timer = timers.schedule(WEAPON_MASTERY_DURATION, end_weapon_mastery)
         elif key == b'3': upgrade_skill('faster_evasion')
         elif key == b'4': upgrade_skill('weapon_power')
         elif key == b'5': upgrade_skill('heat_management')
@@ -1892,12 +3552,16 @@ def keyboardListener(key, x, y):
     elif key == b'q' and not is_evading and can_evade(): 
         is_evading = True
         evade_timer = EVADE_DURATION
+        # The cooldown starts on the evade's last tick
+        evade_cooldown = timers.schedule(EVADE_DURATION + get_evade_cooldown() - 1)
         evade_direction = 1
         consume_evade_stamina()
         trigger_camera_shake(30,20)
     elif key == b'e' and not is_evading and can_evade(): 
         is_evading = True
         evade_timer = EVADE_DURATION
+        # The cooldown starts on the evade's last tick
+        evade_cooldown = timers.schedule(EVADE_DURATION + get_evade_cooldown() - 1)
         evade_direction = -1
         consume_evade_stamina()
         trigger_camera_shake(30,20)
@@ -1927,28 +3591,36 @@ def mouseListener(button, state, x, y):
             if 800 < x < 900 and 750 < y < 790: game_state = "PAUSED"
             elif 910 < x < 990 and 750 < y < 790: 
                 game_state = "START_MENU"
-                boss = None
-                enemies.clear()
+                clear_boss()
+                clear_enemies()
         elif game_state == "PAUSED":
             if 350 < x < 650 and 400 < y < 450: # Resume button
                 game_state = "RESUMING"
                 pre_game_timer = 180 # 3 seconds at 60fps
             elif 350 < x < 650 and 300 < y < 350: game_state = "START_MENU"
-            boss = None
-            enemies.clear()
+            clear_boss()
+            clear_enemies()
 def reset_game():
     global current_score, game_time, player_health, player_pos, bullets, enemies, enemy_bullets, asteroids, boss, heat_level, overheated, weapon_cooldown, is_evading, evade_timer, evade_cooldown, stamina_level, is_sprinting, special_ability_meter, name_input_mode, player_name, spawn_timer, crosshair_pos, current_wave
     current_score, game_time, heat_level, spawn_timer, current_wave = 0, 0, 0, 0, 0
     overheated, is_evading, is_sprinting, name_input_mode = False, False, False, False
     player_name = ""
-    evade_timer, evade_cooldown, weapon_cooldown = 0, 0, 0
+    timers.cancel(evade_cooldown)
+    timers.cancel(weapon_cooldown)
+    evade_timer, evade_cooldown, weapon_cooldown = 0, None, None
     player_pos = [0, 0, 0]
     crosshair_pos = [0, 0, ARENA_DEPTH - 800]
     apply_skill_effects()
     player_health, stamina_level, special_ability_meter = player_max_health, stamina_max, 0
     spawn_obstacles(15)
-    bullets, enemies, enemy_bullets, asteroids = [], [], [], []
-    boss = None
+    clear_projectiles(bullets, bullet_pool)
+    clear_projectiles(enemy_bullets, enemy_bullet_pool)
+    clear_projectiles(asteroids)
+    wall_hazard.clear()
+    particles.clear()
+    clear_enemies()
+    clear_boss()
+    target_registry.clear()
 def handle_player_death():
     global game_state, name_input_mode, player_name
     if player_health <= 0 and game_state == "PLAYING" and not INVINCIBLE_MODE:
@@ -1958,8 +3630,12 @@ def handle_player_death():
             player_name = ""
         else: 
             load_high_scores()
-def idle():
-    global game_time, weapon_cooldown, heat_level, overheated, evade_timer, is_evading, evade_cooldown, player_pos, spawn_timer, player_move_y_timer, player_move_x_timer, crosshair_move_y_timer, crosshair_move_x_timer, fire_timer, mobility_boost_active, mobility_boost_timer, weapon_mastery_active, weapon_mastery_timer, game_state, pre_game_timer, wave_transition_timer, boss,camera_shake_duration,camera_shake_intensity,player_flash_timer
+def simulation_tick():
+    """
+    Advances the game logic by one frame (1/60 s) without drawing anything.
+    idle() runs this under GLUT and run_headless() runs it with no window.
+    """
+    global game_time, heat_level, overheated, evade_timer, is_evading, player_pos, spawn_timer, player_move_y_timer, player_move_x_timer, crosshair_move_y_timer, crosshair_move_x_timer, fire_timer, game_state, pre_game_timer, wave_transition_timer, boss,camera_shake_duration,camera_shake_intensity,player_flash_timer,time_scale
      # --- Camera Shake Decay Logic ---
     if camera_shake_duration > 0:
         camera_shake_duration -= 1
@@ -1975,7 +3651,6 @@ def idle():
    
 
     if game_state not in ["PLAYING", "PRE_GAME", "WAVE_TRANSITION","RESUMING"]:
-        glutPostRedisplay()
         return
     game_time += 1
     if game_state == "PRE_GAME":
@@ -2015,32 +3690,246 @@ def idle():
         player_pos[0] += (get_evade_distance() / EVADE_DURATION) * evade_direction
         evade_timer -= 1
         if evade_timer <= 0: is_evading = False
-        evade_cooldown = get_evade_cooldown()
-    if evade_cooldown > 0: evade_cooldown -= 1
-    if weapon_cooldown > 0: weapon_cooldown -= 1
     if heat_level > 0: heat_level = max(0, heat_level - heat_cool_rate)
     if overheated and heat_level <= (heat_max * 0.1): overheated = False
-    if mobility_boost_timer > 0: mobility_boost_timer -= 1
-    else: mobility_boost_active = False
-    if weapon_mastery_timer > 0: weapon_mastery_timer -= 1
-    else: weapon_mastery_active = False
     if game_state == "PLAYING" and len(enemies) == 0 and (not boss or not boss.alive):
         game_state = "WAVE_TRANSITION"
         wave_transition_timer = WAVE_TRANSITION_DURATION
         # --- Time Scale Logic ---
-    global time_scale
     if special_ability_active and current_special == "TIME_SLOW":
         time_scale = 0.4 # Slow down to 40% speed
     else:
         time_scale = 1# Return to normal speed
     # -----------------------------
     update_stamina()
-    update_special_ability()
     update_bullets()
     update_enemies_and_bullets()
     check_collisions()
     handle_player_death() 
+
+# --- Frame Pacing ---
+class FramePacer:
+    """
+    Holds the game loop to a target frame rate.
+    wait() sleeps until the current frame's deadline with time.sleep() and
+    never spins, so the CPU stays idle for the whole slack. sleep() can
+    overshoot by a millisecond or so, but deadlines advance by exactly one
+    frame time, so oversleeps don't add up, and the fixed timestep turns
+    the real time that passed into ticks either way.
+    After a stall of more than one frame, the schedule restarts instead of
+    racing to catch up. The real time between frames is kept for fps() and
+    jitter_ms().
+    """
+    def __init__(self, target_fps, history=120):
+        self.frame_time = 1.0 / target_fps if target_fps > 0 else 0.0
+        self.deadline = None
+        self.last_frame = None
+        self.intervals = deque(maxlen=history)
+
+    def reset(self):
+        """Forget the schedule, e.g. after the loop was stopped on a menu."""
+        self.deadline = None
+        self.last_frame = None
+
+    def set_target(self, target_fps):
+        """Changes the frame rate wait() holds to (0 = don't wait, only measure)."""
+        self.frame_time = 1.0 / target_fps if target_fps > 0 else 0.0
+        self.reset()
+
+    def wait(self):
+        if self.frame_time > 0:
+            now = time.perf_counter()
+            if self.deadline is None or now > self.deadline + self.frame_time:
+                self.deadline = now
+            else:
+                remaining = self.deadline - now
+                if remaining > 0:
+                    time.sleep(remaining)
+            self.deadline += self.frame_time
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.intervals.append(now - self.last_frame)
+        self.last_frame = now
+
+    def fps(self):
+        if not self.intervals:
+            return 0.0
+        return len(self.intervals) / sum(self.intervals)
+
+    def jitter_ms(self):
+        """Standard deviation of the frame time, in milliseconds."""
+        if len(self.intervals) < 2:
+            return 0.0
+        mean = sum(self.intervals) / len(self.intervals)
+        variance = sum((t - mean) ** 2 for t in self.intervals) / len(self.intervals)
+        return math.sqrt(variance) * 1000
+
+frame_pacer = FramePacer(TARGET_FPS)
+
+def set_vsync(enabled):
+    """Asks the platform's swap-interval extension to (not) wait for the display refresh. Returns False if it can't."""
+    interval = 1 if enabled else 0
+    try:
+        if sys.platform == "win32":
+            from OpenGL.WGL.EXT.swap_control import wglSwapIntervalEXT
+            return bool(wglSwapIntervalEXT(interval))
+        if sys.platform == "darwin":
+            cgl = ctypes.cdll.LoadLibrary("/System/Library/Frameworks/OpenGL.framework/OpenGL")
+            cgl.CGLGetCurrentContext.restype = ctypes.c_void_p
+            swap_interval = 222 # kCGLCPSwapInterval
+            return cgl.CGLSetParameter(ctypes.c_void_p(cgl.CGLGetCurrentContext()), swap_interval, ctypes.byref(ctypes.c_int(interval))) == 0
+        from OpenGL.GLX.MESA.swap_control import glXSwapIntervalMESA
+        if bool(glXSwapIntervalMESA):
+            return glXSwapIntervalMESA(interval) == 0
+        from OpenGL.GLX import glXGetCurrentDisplay, glXGetCurrentDrawable
+        from OpenGL.GLX.EXT.swap_control import glXSwapIntervalEXT
+        glXSwapIntervalEXT(glXGetCurrentDisplay(), glXGetCurrentDrawable(), interval)
+        return True
+    except Exception as e:
+        print(f"Could not change vsync: {e}")
+        return False
+
+# --- Redraw Scheduling ---
+# During gameplay GLUT calls idle() continuously. Once the game sits on a
+# static screen, idle() unregisters itself after posting a last frame, and
+# GLUT just waits for events. Every input callback is wrapped by
+# redraws_after(), which posts a redraw and restarts the idle loop if the
+# input put the game back into an animated state.
+ANIMATED_STATES = ["PLAYING", "PRE_GAME", "WAVE_TRANSITION", "RESUMING"]
+idle_running = True
+
+def scene_is_animating():
+    # The damage flash and camera shake keep fading even on the pause screen
+    return game_state in ANIMATED_STATES or camera_shake_duration > 0 or player_flash_timer > 0
+
+def set_idle_running(running):
+    global idle_running
+    if running != idle_running:
+        glutIdleFunc(idle if running else None)
+        idle_running = running
+        frame_pacer.reset()
+        reset_sim_clock()
+
+def request_redraw():
+    glutPostRedisplay()
+    if scene_is_animating():
+        set_idle_running(True)
+
+def redraws_after(handler):
+    """Wraps a GLUT input callback so every event schedules a redraw."""
+    def callback(*args):
+        handler(*args)
+        request_redraw()
+    return callback
+
+# --- Fixed Timestep ---
+# idle() banks the real time since the last frame and spends it in whole
+# simulation ticks of SIM_DT, so the game runs at the same speed whatever the
+# frame rate. Before each tick, snapshot_positions() keeps the old positions.
+# The leftover fraction of a tick (render_alpha) tells render_frame() how far
+# to draw everything between the previous and the current tick.
+SIM_DT = 1.0 / SIM_TICKS_PER_SECOND
+# Moves longer than this in one tick (warps, respawns) are drawn as jumps
+TELEPORT_DISTANCE = 100
+sim_accumulator = 0.0
+last_idle_time = None
+render_alpha = 1.0
+# Ticks' worth of real time the starfield still has to move by. Each idle()
+# adds its elapsed time (so nothing is lost when GLUT draws once for several
+# idle calls), capped at MAX_SIM_TICKS_PER_FRAME, and drawing a frame uses
+# it up
+render_tick_delta = 0.0
+prev_player_pos = list(player_pos)
+prev_crosshair_pos = list(crosshair_pos)
+
+def reset_sim_clock():
+    global sim_accumulator, last_idle_time
+    sim_accumulator = 0.0
+    last_idle_time = None
+
+def snapshot_positions():
+    global prev_player_pos, prev_crosshair_pos
+    prev_player_pos = list(player_pos)
+    prev_crosshair_pos = list(crosshair_pos)
+    bullet_store.snapshot()
+    enemy_bullet_store.snapshot()
+    asteroid_store.snapshot()
+    wall_hazard.snapshot()
+    particles.snapshot()
+    for enemy in enemies:
+        enemy.prev_pos = list(enemy.pos)
+    if boss:
+        boss.prev_pos = list(boss.pos)
+
+def lerp_position(prev, current, alpha):
+    if prev is None:
+        return current
+    dx, dy, dz = current[0] - prev[0], current[1] - prev[1], current[2] - prev[2]
+    if dx*dx + dy*dy + dz*dz > TELEPORT_DISTANCE ** 2:
+        return current
+    return [prev[0] + dx * alpha, prev[1] + dy * alpha, prev[2] + dz * alpha]
+
+def render_frame():
+    """Display callback: draws the world render_alpha of the way from the previous tick to the current one."""
+    global player_pos, crosshair_pos, render_tick_delta
+    if render_alpha >= 1 or game_state not in ANIMATED_STATES:
+        showScreen()
+        render_tick_delta = 0.0
+        return
+    # Swap interpolated positions in for the draw only, then put the real ones back
+    saved_player, saved_crosshair = player_pos, crosshair_pos
+    saved_stores = [(store, store.pos) for store in (bullet_store, enemy_bullet_store, asteroid_store, particles)]
+    saved_entities = [(entity, entity.pos) for entity in enemies + ([boss] if boss else [])]
+    saved_wall_z = wall_hazard.z
+    player_pos = lerp_position(prev_player_pos, player_pos, render_alpha)
+    crosshair_pos = lerp_position(prev_crosshair_pos, crosshair_pos, render_alpha)
+    for store, pos in saved_stores:
+        store.pos = store.interpolated_pos(render_alpha)
+    for entity, pos in saved_entities:
+        entity.pos = lerp_position(entity.prev_pos, pos, render_alpha)
+    wall_hazard.z = wall_hazard.interpolated_z(render_alpha)
+    try:
+        showScreen()
+    finally:
+        player_pos, crosshair_pos = saved_player, saved_crosshair
+        for store, pos in saved_stores:
+            store.pos = pos
+        for entity, pos in saved_entities:
+            entity.pos = pos
+        wall_hazard.z = saved_wall_z
+        render_tick_delta = 0.0
+
+def idle():
+    global sim_accumulator, last_idle_time, render_alpha, render_tick_delta
+    frame_pacer.wait()
+    now = time.perf_counter()
+    if last_idle_time is None:
+        elapsed = SIM_DT
+    else:
+        elapsed = now - last_idle_time
+    last_idle_time = now
+    sim_accumulator += elapsed
+    ticks = 0
+    while sim_accumulator >= SIM_DT and ticks < MAX_SIM_TICKS_PER_FRAME:
+        snapshot_positions()
+        simulation_tick()
+        sim_accumulator -= SIM_DT
+        ticks += 1
+    if sim_accumulator >= SIM_DT:
+        # Still behind after the catch-up limit: drop the backlog and let the game slow down
+        sim_accumulator %= SIM_DT
+    if INTERPOLATE_RENDERING:
+        render_alpha = sim_accumulator / SIM_DT
+    else:
+        render_alpha = 1.0
+    if game_state in ANIMATED_STATES:
+        render_tick_delta = min(render_tick_delta + elapsed / SIM_DT, MAX_SIM_TICKS_PER_FRAME)
+    else:
+        # Paused (or any other static screen): the starfield holds still
+        render_tick_delta = 0.0
     glutPostRedisplay()
+    if EVENT_DRIVEN_MENUS and not scene_is_animating():
+        set_idle_running(False)
 
 def setupCamera():
     glMatrixMode(GL_PROJECTION)
@@ -2078,6 +3967,7 @@ def setupCamera():
     global camera_pos
     camera_pos = [cam_x, cam_y, cam_z]
     # -----------------------------------------
+    update_view_frustum(camera_pos, (look_at_x, look_at_y, look_at_z), 0.1, ARENA_DEPTH * 1.5)
     gluLookAt(cam_x, cam_y, cam_z, look_at_x, look_at_y, look_at_z, 0, 1, 0)
 def showScreen():
     global player_flash_timer
@@ -2090,61 +3980,29 @@ def showScreen():
         setupCamera()
         draw_stars()
         draw_corridor()
-        for bullet in bullets: bullet.draw()
-        for bullet in enemy_bullets: bullet.draw()
-        for asteroid in asteroids: asteroid.draw()
-        for obstacle in obstacles: obstacle.draw() #<-- ADD THIS LINE
-        if boss and boss.alive: boss.draw()
-        for enemy in enemies: enemy.draw()
+        draw_lasers()
+        draw_enemy_bullets()
+        for asteroid in asteroids:
+            if asteroid.alive and sphere_in_view(asteroid.pos, asteroid.radius): asteroid.draw()
+        # Cubes: the bounding sphere reaches the corners
+        for obstacle in obstacles:
+            if obstacle.alive and sphere_in_view(obstacle.pos, obstacle.size * 0.87): obstacle.draw()
+        if boss and boss.alive and sphere_in_view(boss.pos, boss.radius * 1.5): boss.draw()
+        # Enemy parts (rings, arms, cannons) stick out a little past the radius
+        for enemy in enemies:
+            if enemy.alive and sphere_in_view(enemy.pos, enemy.radius * 1.5): enemy.draw()
+        particles.draw()
         # if camera_mode != "FIRST_PERSON": # Only draw the player if not in first-person
         draw_3d_player()
         glClear(GL_DEPTH_BUFFER_BIT)
         draw_crosshair()
        # --- Draw Player Damage Flash Border  ---
         if player_flash_timer > 0:
-            glMatrixMode(GL_PROJECTION)
-            glPushMatrix()
-            glLoadIdentity()
-            gluOrtho2D(0,1000,0,800)
-            glMatrixMode(GL_MODELVIEW)
-            glPushMatrix()
-            glLoadIdentity()
-
-            glColor3f(1, 0, 0) # Solid Red
             border_thickness = 10
-            # Top bar
-            glBegin(GL_QUADS)
-            glVertex3f(0, 800-border_thickness, 0)
-            glVertex3f(1000, 800-border_thickness, 0)
-            glVertex3f(1000, 800, 0)
-            glVertex3f(0, 800, 0)
-            glEnd()
-            # Bottom bar
-            glBegin(GL_QUADS)
-            glVertex3f(0, 0, 0)
-            glVertex3f(1000, 0, 0)
-            glVertex3f(1000, border_thickness, 0)
-            glVertex3f(0, border_thickness, 0)
-            glEnd()
-            # Left bar
-            glBegin(GL_QUADS)
-            glVertex3f(0, 0, 0)
-            glVertex3f(border_thickness, 0, 0)
-            glVertex3f(border_thickness, 800, 0)
-            glVertex3f(0, 800, 0)
-            glEnd()
-            # Right bar
-            glBegin(GL_QUADS)
-            glVertex3f(1000-border_thickness, 0, 0)
-            glVertex3f(1000, 0, 0)
-            glVertex3f(1000, 800, 0)
-            glVertex3f(1000-border_thickness, 800, 0)
-            glEnd()
-
-            glPopMatrix()
-            glMatrixMode(GL_PROJECTION)
-            glPopMatrix()
-            glMatrixMode(GL_MODELVIEW)
+            overlay_rect(0, 800 - border_thickness, 1000, border_thickness, (1, 0, 0)) # Top bar
+            overlay_rect(0, 0, 1000, border_thickness, (1, 0, 0)) # Bottom bar
+            overlay_rect(0, 0, border_thickness, 800, (1, 0, 0)) # Left bar
+            overlay_rect(1000 - border_thickness, 0, border_thickness, 800, (1, 0, 0)) # Right bar
         # -----------------------------------------------------------------
 
     
@@ -2157,16 +4015,23 @@ def showScreen():
     else: 
         draw_enhanced_hud()
         if boss and boss.alive: draw_boss_health_bar()
+        if SHOW_CULL_STATS:
+            set_text_color(0.7, 0.7, 0.7)
+            draw_text(10, 600, f"CULL: {cull_stats['drawn']} drawn, {cull_stats['culled']} culled")
+        if SHOW_FPS_STATS:
+            set_text_color(0.7, 0.7, 0.7)
+            draw_text(10, 575, f"FPS: {frame_pacer.fps():.1f}  JITTER: {frame_pacer.jitter_ms():.2f} ms")
         if game_state == "PRE_GAME":
-            glColor3f(1,1,1)
+            set_text_color(1,1,1)
             draw_text(400, 400, f"GET READY... {int(pre_game_timer/60) + 1}")
         if game_state == "WAVE_TRANSITION":
-            glColor3f(1,1,1)
+            set_text_color(1,1,1)
             draw_text(450, 400, f"WAVE {current_wave+1}")
         elif game_state == "RESUMING":
-            glColor3f(1,1,1)
+            set_text_color(1,1,1)
             draw_text(420, 400, f"RESUMING IN {int(pre_game_timer/60) + 1}...")
 
+    flush_overlay()
     glutSwapBuffers()
 def main():
     glutInit()
@@ -2175,16 +4040,108 @@ def main():
     glutInitWindowPosition(0, 0)
     glutCreateWindow(b"Alien Invasion Survival - Final Build")
     glEnable(GL_DEPTH_TEST)
+    if USE_VSYNC is not None and set_vsync(USE_VSYNC) and USE_VSYNC:
+        # Each swap now waits for the display, so sleeping as well would only add latency
+        frame_pacer.set_target(0)
+    build_mesh_cache()
+    init_enemy_bullet_renderer()
+    build_text_atlas()
     init_stars()
+    init_star_renderer()
     load_high_scores()
     apply_skill_effects()
-    glutDisplayFunc(showScreen)
-    glutKeyboardFunc(keyboardListener)
-    glutSpecialFunc(specialKeyListener)
-    glutMouseFunc(mouseListener)
+    glutDisplayFunc(render_frame)
+    glutKeyboardFunc(redraws_after(keyboardListener))
+    glutSpecialFunc(redraws_after(specialKeyListener))
+    glutMouseFunc(redraws_after(mouseListener))
     glutIdleFunc(idle)
     print("Game Initialized.")
     glutMainLoop()
 
+# =============================
+# Headless Simulation
+# =============================
+
+def autopilot_input(tick):
+    """Fakes player input for headless runs: keeps firing at the nearest threat and weaves around."""
+    global fire_timer, player_move_x_timer, player_move_x_dir, player_move_y_timer, player_move_y_dir
+    fire_timer = INPUT_TIMEOUT
+    if tick % 90 == 0:
+        player_move_x_dir = random.choice([-1, 1])
+        player_move_y_dir = random.choice([-1, 1])
+    player_move_x_timer = INPUT_TIMEOUT
+    player_move_y_timer = INPUT_TIMEOUT
+    # Snap the crosshair onto the boss or the first enemy so waves get cleared.
+    if boss and boss.alive:
+        target = boss
+    elif enemies:
+        target = enemies[0]
+    else:
+        return
+    crosshair_pos[0], crosshair_pos[1] = target.pos[0], target.pos[1]
+
+def run_headless(ticks, seed=None, autopilot=True):
+    """
+    Runs the simulation for a number of ticks as fast as possible, without
+    creating a window. The game restarts by itself whenever the player dies,
+    which makes it usable for both benchmarking and long soak tests.
+    Returns a dictionary with the run statistics.
+    """
+    global game_state, pre_game_timer
+    if seed is not None:
+        random.seed(seed)
+    apply_skill_effects()
+    reset_game()
+    game_state = "PRE_GAME"
+    pre_game_timer = 1 # Skip the countdown, nobody is watching
+    deaths = 0
+    highest_wave = 0
+
+    start_time = time.perf_counter()
+    for tick in range(ticks):
+        if game_state == "GAME_OVER":
+            deaths += 1
+            reset_game()
+            game_state = "PRE_GAME"
+            pre_game_timer = 1
+        if autopilot:
+            autopilot_input(tick)
+        simulation_tick()
+        highest_wave = max(highest_wave, current_wave)
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "ticks": ticks,
+        "seconds": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float('inf'),
+        "highest_wave": highest_wave,
+        "deaths": deaths,
+        "score": current_score,
+        "pooled_spawns": bullet_pool.reused + enemy_bullet_pool.reused,
+        "new_spawns": bullet_pool.created + enemy_bullet_pool.created,
+    }
+
+def headless_main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Run the Alien Invasion simulation without a window.")
+    parser.add_argument("--headless", action="store_true", help="run without GLUT/OpenGL")
+    parser.add_argument("--ticks", type=int, default=10000, help="number of 60 Hz frames to simulate")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for a repeatable run")
+    parser.add_argument("--no-autopilot", action="store_true", help="don't fake any player input")
+    parser.add_argument("--debug-compaction", action="store_true", help="verify every dead-entity compaction pass")
+    args = parser.parse_args()
+
+    global DEBUG_COMPACTION
+    DEBUG_COMPACTION = args.debug_compaction
+
+    stats = run_headless(args.ticks, seed=args.seed, autopilot=not args.no_autopilot)
+    print(f"Simulated {stats['ticks']} ticks in {stats['seconds']:.2f}s "
+          f"({stats['ticks_per_second']:.0f} ticks/s)")
+    print(f"Highest wave: {stats['highest_wave']}  Deaths: {stats['deaths']}  Score: {stats['score']}")
+    print(f"Projectiles: {stats['pooled_spawns']} reused from pools, {stats['new_spawns']} newly built")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--headless" in sys.argv:
+        headless_main()
+    else:
+        main()
\ No newline at end of file